@@ -0,0 +1,196 @@
+"""Offline stand-ins for the Groq SDK, Gemini and the GitHub API used by the benchmarks.
+
+The fakes mimic just the client surface the services touch and sleep for a
+configurable time to model API latency, so results measure our own
+overhead and concurrency behaviour rather than the network.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+import httpx
+
+
+FAKE_AUDIO_CHUNK = b"\xff\xfb" + b"\x00" * 16382  # one 16KB "mp3" chunk
+
+
+class _Namespace:
+    pass
+
+
+class _FakeSpeechResponse:
+    def __init__(self, chunks: int, chunk_delay: float):
+        self.chunks = chunks
+        self.chunk_delay = chunk_delay
+
+    def iter_bytes(self, chunk_size: int = 16384):
+        for _ in range(self.chunks):
+            time.sleep(self.chunk_delay)
+            yield FAKE_AUDIO_CHUNK
+
+    def write_to_file(self, path: str) -> None:
+        with open(path, "wb") as f:
+            for chunk in self.iter_bytes():
+                f.write(chunk)
+
+
+class _FakeAsyncSpeechResponse(_FakeSpeechResponse):
+    async def iter_bytes(self, chunk_size: int = 16384):
+        for _ in range(self.chunks):
+            await asyncio.sleep(self.chunk_delay)
+            yield FAKE_AUDIO_CHUNK
+
+
+class FakeGroq:
+    """Blocking Groq client: `ttfb` before the first chunk, `chunk_delay` per chunk."""
+
+    def __init__(self, ttfb: float = 0.2, chunks: int = 8, chunk_delay: float = 0.05,
+                 stt_latency: float = 0.3, transcript: str = "fake transcript"):
+        self.calls = 0
+        self.audio = _Namespace()
+        self.audio.speech = _Namespace()
+        self.audio.speech.create = self._create_speech
+        self.audio.speech.with_streaming_response = _Namespace()
+        self.audio.speech.with_streaming_response.create = self._stream_speech
+        self.audio.transcriptions = _Namespace()
+        self.audio.transcriptions.create = self._transcribe
+        self.ttfb = ttfb
+        self.chunks = chunks
+        self.chunk_delay = chunk_delay
+        self.stt_latency = stt_latency
+        self.transcript = transcript
+
+    def with_options(self, **kwargs):
+        return self
+
+    def _create_speech(self, **kwargs):
+        self.calls += 1
+        time.sleep(self.ttfb)
+        return _FakeSpeechResponse(self.chunks, self.chunk_delay)
+
+    @contextmanager
+    def _stream_speech(self, **kwargs):
+        yield self._create_speech(**kwargs)
+
+    def _transcribe(self, **kwargs):
+        self.calls += 1
+        time.sleep(self.stt_latency)
+        result = _Namespace()
+        result.text = self.transcript
+        return result
+
+
+class FakeAsyncGroq(FakeGroq):
+    """Non-blocking counterpart of FakeGroq matching the AsyncGroq surface."""
+
+    async def _create_speech(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.ttfb)
+        return _FakeAsyncSpeechResponse(self.chunks, self.chunk_delay)
+
+    @asynccontextmanager
+    async def _stream_speech(self, **kwargs):
+        yield await self._create_speech(**kwargs)
+
+    async def _transcribe(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.stt_latency)
+        result = _Namespace()
+        result.text = self.transcript
+        return result
+
+
+class FakeGeminiResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.parts = [text]
+        self.prompt_feedback = None
+
+
+class FakeGeminiModel:
+    """Drop-in for `genai.GenerativeModel` returning canned interview JSON after `latency`."""
+
+    latency = 0.0
+    questions = 10
+
+    def __init__(self, *args, **kwargs):
+        self.calls = 0
+
+    def _payload(self) -> str:
+        return json.dumps({"questions": [
+            {
+                "question": f"How does component {i} handle failures?",
+                "category": "Architecture & Design",
+                "difficulty": "Medium",
+                "expectedKeyPoints": ["Error handling", "Retries", "Observability"],
+                "context": "Generated by the benchmark fake",
+            }
+            for i in range(self.questions)
+        ]})
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls += 1
+        time.sleep(self.latency)
+        return FakeGeminiResponse(self._payload())
+
+    async def generate_content_async(self, prompt, stream: bool = False, **kwargs):
+        self.calls += 1
+        if stream:
+            return self._stream(self._payload())
+        await asyncio.sleep(self.latency)
+        return FakeGeminiResponse(self._payload())
+
+    async def _stream(self, payload: str, chunk_chars: int = 64):
+        """Yield the payload in small chunks, spreading `latency` across them."""
+        chunks = [payload[i:i + chunk_chars] for i in range(0, len(payload), chunk_chars)]
+        for chunk in chunks:
+            await asyncio.sleep(self.latency / len(chunks))
+            yield FakeGeminiResponse(chunk)
+
+
+class FakeGitHub:
+    """Serves every `owner/repo` as the same synthetic repository through `httpx.MockTransport`.
+
+    Handles the tree, blob and contents endpoints used by GitHubClient;
+    `files` maps paths to their text.
+    """
+
+    def __init__(self, files: dict, latency: float = 0.0):
+        self.files = files
+        self.latency = latency
+        self.calls = 0
+        self._blobs = {}
+        self._tree = []
+        for path, text in files.items():
+            sha = hashlib.sha1(text.encode()).hexdigest()
+            self._blobs[sha] = text
+            self._tree.append({"path": path, "type": "blob", "sha": sha, "size": len(text)})
+
+    @staticmethod
+    def _encoded(text: str) -> str:
+        return base64.b64encode(text.encode()).decode()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        parts = request.url.path.strip("/").split("/")
+        # /repos/{owner}/{repo}/...
+        route = parts[3:]
+        if route[:2] == ["git", "trees"]:
+            return httpx.Response(200, json={"sha": "benchtree", "tree": self._tree, "truncated": False})
+        if route[:2] == ["git", "blobs"] and route[2] in self._blobs:
+            return httpx.Response(200, json={"content": self._encoded(self._blobs[route[2]]), "encoding": "base64"})
+        if route[:1] == ["contents"]:
+            path = "/".join(route[1:])
+            if path in self.files:
+                sha = hashlib.sha1(self.files[path].encode()).hexdigest()
+                return httpx.Response(200, json={"content": self._encoded(self.files[path]), "sha": sha})
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handler)
@@ -0,0 +1,95 @@
+"""
+Micro-benchmark: README cleaning, old BeautifulSoup path vs src.text_cleaner.
+
+The old path parsed the whole README with BeautifulSoup and sliced the
+result afterwards; clean_markdown also drops badges, images, link URLs and
+long code blocks, and stops once it has `--cap` characters.
+
+Run from GithubFeature/:
+    python -m benchmarks.readme_cleaner --size 500000 --cap 19200
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.text_cleaner import clean_markdown
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+
+SECTION = """
+<p align="center">
+  <img src="https://example.com/logo.png"
+       alt="Logo" width="200">
+</p>
+<p align="center"><a href="https://github.com/acme/demo/actions"><img
+  src="https://img.shields.io/badge/build-passing-green" /></a></p>
+<p align="center"><img src="docs/logo.png" width="200"/></p>
+<h2 align="center">Feature &amp; usage</h2>
+
+[![Build](https://img.shields.io/github/actions/workflow/status/acme/demo/ci.yml)](https://github.com/acme/demo/actions)
+[![Coverage](https://img.shields.io/codecov/c/github/acme/demo)](https://codecov.io/gh/acme/demo)
+![Screenshot](https://raw.githubusercontent.com/acme/demo/main/docs/screenshot.png)
+
+The service is built with **FastAPI** and uses [Redis](https://redis.io) for caching
+and [PostgreSQL](https://www.postgresql.org) for storage.   Requests are   validated
+with <code>pydantic</code> models.<br/>
+
+```bash
+pip install -r requirements.txt
+uvicorn main:app --reload --port 8000
+export DATABASE_URL=postgresql://localhost/demo
+```
+
+| Endpoint | Method | Description |
+|----------|:------:|-------------|
+| /items   | GET    | List items  |
+"""
+
+
+def make_readme(size: int) -> str:
+    return (SECTION * (size // len(SECTION) + 1))[:size]
+
+
+def bench(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--cap", type=int, default=19_200, help="Output cap in characters")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'input chars':>12} {'variant':<22} {'median ms':>10} {'output chars':>13}")
+    for size in args.size:
+        readme = make_readme(size)
+        variants = [
+            ("clean_markdown (cap)", lambda: clean_markdown(readme, args.cap)),
+            ("clean_markdown (full)", lambda: clean_markdown(readme)),
+        ]
+        if BeautifulSoup is not None:
+            variants.insert(0, ("BeautifulSoup + slice", lambda: BeautifulSoup(readme, "html.parser").get_text()[:args.cap]))
+        for name, fn in variants:
+            ms = bench(fn, args.repeat)
+            print(f"{size:>12} {name:<22} {ms:>10.2f} {len(fn()):>13}")
+    if BeautifulSoup is None:
+        print("(beautifulsoup4 not installed; old path skipped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark: STT preprocessing (silence trim + 16 kHz mono) on a recording.
+
+Reports bytes and seconds of audio saved and the CPU time it costs. Defaults
+to the repo's speech.wav; pass any WAV (or other formats if ffmpeg is on PATH).
+
+Run from GithubFeature/:
+    python -m benchmarks.stt_preprocess [path/to/audio.wav] --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import audio_preprocess
+from src.audio_preprocess import preprocess_audio
+
+
+def main():
+    default_audio = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "speech.wav")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("audio", nargs="?", default=default_audio)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.audio, 'rb') as f:
+        content = f.read()
+
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        filename, processed, report = preprocess_audio(os.path.basename(args.audio), content)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    print(f"audioop fast path: {'yes' if audio_preprocess.audioop else 'no'}, "
+          f"ffmpeg: {audio_preprocess.FFMPEG or 'not found'}")
+    for key, value in report.items():
+        print(f"{key:>22}: {value}")
+    if report.get("applied"):
+        print(f"{'size reduction':>22}: {100 * report['bytes_saved'] / report['original_bytes']:.1f}%")
+    print(f"{'preprocess ms':>22}: median {statistics.median(timings):.1f}, max {max(timings):.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Load benchmark: concurrent /voice/tts streams on a single worker.
+
+Compares the old blocking path (sync Groq client + temp file, iterated by
+Starlette in its threadpool) with the AsyncGroq path, both against the fake
+Groq backend so no API key or network is needed.
+
+Run from GithubFeature/:
+    python -m benchmarks.tts_concurrency --concurrency 10 50 100 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+# Keep the benchmark's TTS cache out of the real one, and start it empty
+os.environ["TTS_CACHE_DIR"] = tempfile.mkdtemp(prefix="tts_bench_")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+import voice_service
+from voice_service import SpeechRequest
+from benchmarks.fakes import FakeAsyncGroq, FakeGroq
+
+
+def legacy_build_audio_stream(client: FakeGroq, request: SpeechRequest):
+    """The pre-async implementation: blocking call, write to file, read back."""
+    response = client.audio.speech.create(model="playai-tts", voice="Aaliyah-PlayAI",
+                                          response_format="mp3", input=request.text)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as tmp:
+        tmp_path = tmp.name
+    response.write_to_file(tmp_path)
+    with open(tmp_path, 'rb') as audio_file:
+        while True:
+            chunk = audio_file.read(16384)
+            if not chunk:
+                break
+            yield chunk
+    os.unlink(tmp_path)
+
+
+def build_app(mode: str, fake_kwargs: dict) -> FastAPI:
+    app = FastAPI()
+    if mode == "legacy":
+        client = FakeGroq(**fake_kwargs)
+
+        @app.post("/voice/tts")
+        async def legacy_tts(request: SpeechRequest):
+            return StreamingResponse(legacy_build_audio_stream(client, request), media_type="audio/mpeg")
+    else:
+        client = FakeAsyncGroq(**fake_kwargs)
+        voice_service.get_async_groq_client = lambda: client
+        app.include_router(voice_service.router)
+    return app
+
+
+async def run_load(app: FastAPI, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def one_request() -> float:
+            started = time.perf_counter()
+            # Unique text so every request is a cache miss
+            r = await client.post("/voice/tts", json={"text": f"Benchmark sentence {uuid.uuid4()}"})
+            r.raise_for_status()
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*(one_request() for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    latencies = sorted(latencies)
+    return {
+        "concurrency": concurrency,
+        "wall_s": wall,
+        "streams_per_s": concurrency / wall,
+        "p50_s": statistics.median(latencies),
+        "p95_s": latencies[int(0.95 * (len(latencies) - 1))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 100, 200])
+    parser.add_argument("--ttfb", type=float, default=0.2, help="Fake Groq time to first byte (s)")
+    parser.add_argument("--chunks", type=int, default=8, help="Chunks per synthesized clip")
+    parser.add_argument("--chunk-delay", type=float, default=0.05, help="Delay between chunks (s)")
+    args = parser.parse_args()
+
+    fake_kwargs = {"ttfb": args.ttfb, "chunks": args.chunks, "chunk_delay": args.chunk_delay}
+    single_stream = args.ttfb + args.chunks * args.chunk_delay
+    print(f"Fake synthesis time per stream: {single_stream:.2f}s")
+    print(f"{'mode':<8} {'streams':>8} {'wall(s)':>9} {'streams/s':>10} {'p50(s)':>8} {'p95(s)':>8}")
+
+    for mode in ("legacy", "async"):
+        for concurrency in args.concurrency:
+            result = asyncio.run(run_load(build_app(mode, fake_kwargs), concurrency))
+            print(f"{mode:<8} {result['concurrency']:>8} {result['wall_s']:>9.2f} "
+                  f"{result['streams_per_s']:>10.1f} {result['p50_s']:>8.2f} {result['p95_s']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
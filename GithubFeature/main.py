@@ -3,23 +3,94 @@ from dotenv import load_dotenv
 # Load environment variables FIRST, before any other imports
 load_dotenv()
 
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from contextlib import asynccontextmanager
+from typing import List, Literal, Optional
+
+from fastapi import FastAPI, HTTPException, UploadFile, File, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse, PlainTextResponse
 from pydantic import BaseModel
-import requests
+import anyio
+import asyncio
 import os
 import json
+import time
 import google.generativeai as genai  # <-- Import Gemini
-from bs4 import BeautifulSoup
 
 # Import voice service router (after load_dotenv)
-from voice_service import router as voice_router
+from voice_service import router as voice_router, warm_tts_cache
+
+# Upload size limits
+from src.uploads import (
+    UploadSizeLimitMiddleware, read_upload,
+    MAX_RESUME_UPLOAD_BYTES, MAX_AUDIO_UPLOAD_BYTES, MAX_BATCH_UPLOAD_BYTES
+)
+
+# Process-pool batch resume parsing
+from src.resume_pool import (
+    parse_batch, parse_resume_cached, expand_zip, shutdown_parse_pool,
+    parse_stats, MAX_BATCH_FILES
+)
+
+# Shared, pooled GitHub API client
+from src.github_client import get_github_client, close_github_client
+
+# Content-addressed cache of generated interviews
+from src.cache import get_analysis_cache, get_etag_cache, get_resume_store, analysis_cache_key
+
+# Token-budgeted README + key source files for the prompt
+from src.repo_context import build_repo_context
+
+# Global cap on concurrent Gemini calls, plus a circuit breaker and timeout
+from src.limiter import get_llm_limiter, get_llm_breaker, LLM_TIMEOUT_SECONDS
+
+# Offline question bank for the low-latency / degraded mode
+from src.question_bank import get_question_bank
+
+# Resume-to-interview pipeline: repo links from resumes, cross-repo question merging
+from src.services import github_repo_from_link
+from src.question_merge import QuestionMerger
+
+# Shared, pre-configured Gemini models
+from src.model_registry import get_model, model_name, warm_up_models
 
-# Resume parsing helper
-from src.services import extract_resume_info
+# Request coalescing for identical concurrent analyses
+from src.singleflight import SingleFlight
 
+# Per-stage latency histograms, sampled traces and the slow-request log
+from src.metrics import MetricsMiddleware, FALLBACKS, observe_stage, render_metrics, slow_requests, stage
 
-app = FastAPI(title="Sarthi AI Services API")
+# Incremental parsing of streamed Gemini JSON
+from src.json_stream import JsonArrayStreamer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warm_up_models()
+    tts_warmup = None
+    if os.getenv("TTS_WARMUP", "false").lower() == "true":
+        # Pre-render hot phrases in the background so startup isn't delayed
+        tts_warmup = asyncio.create_task(warm_tts_cache())
+    yield
+    if tts_warmup and not tts_warmup.done():
+        tts_warmup.cancel()
+    await close_github_client()
+    shutdown_parse_pool()
+
+
+app = FastAPI(title="Sarthi AI Services API", lifespan=lifespan)
+
+# Reject oversized uploads before they are buffered (added before CORS so its
+# 413s still carry the CORS headers the browser needs to read them)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    limits={
+        "/parse-resume": MAX_RESUME_UPLOAD_BYTES,
+        "/parse-resumes": MAX_BATCH_UPLOAD_BYTES,
+        "/resume-to-interview": MAX_RESUME_UPLOAD_BYTES,
+        "/voice/stt": MAX_AUDIO_UPLOAD_BYTES,
+    },
+)
 
 # Configure CORS
 app.add_middleware(
@@ -35,6 +106,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Time every request (added last so it wraps the other middleware too)
+app.add_middleware(MetricsMiddleware)
+
 # Include voice service routes
 app.include_router(voice_router)
 
@@ -47,54 +121,120 @@ def health_check():
             "gemini": bool(os.getenv("GOOGLE_API_KEY")),
             "groq": bool(os.getenv("GROQ_API_KEY")),
             "github_token": bool(os.getenv("GITHUB_TOKEN"))
-        }
+        },
+        "cache": {
+            "analysis": get_analysis_cache().stats(),
+            "github_etags": get_etag_cache().stats(),
+            "resumes": get_resume_store().stats()
+        },
+        "llm_limiter": get_llm_limiter().stats(),
+        "llm_breaker": get_llm_breaker().stats(),
+        "question_bank": get_question_bank().stats(),
+        "coalescing": analysis_flight.stats(),
+        "resume_parser": parse_stats.stats(),
+        "slow_requests": slow_requests.entries()
     }
 
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Per-stage and per-route latency histograms in Prometheus text format."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 @app.post('/parse-resume')
-async def parse_resume(file: UploadFile = File(...)):
+async def parse_resume(response: Response, file: UploadFile = File(...)):
     """Accept a PDF upload and return parsed resume fields as JSON.
     curl -X POST "http://127.0.0.1:8000/parse-resume" -F "file=@C:\\path\\to\\resume.pdf"
-    Uses src.services.extract_resume_info which expects a file path, so the
-    uploaded file is saved temporarily and removed after processing.
+    The upload is parsed straight from memory by src.services.extract_resume_info,
+    no temporary file is written. Parsing runs on the resume process pool so the
+    event loop stays free; X-Queue-Wait-Ms and X-Parse-Ms report where time went.
+    Results are stored by a hash of the PDF bytes, so re-uploading the same file
+    skips parsing (X-Resume-Cache: hit).
     
     Returns:
         {
             "name": str | null,
             "email": str | null,
-            "github_links": list[str]
+            "github_links": list[str],
+            "linkedin": str | null,
+            "phone": str | null
         }
     """
     if not file.filename or not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail='Only PDF uploads are supported')
 
-    import tempfile, os
-
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-            contents = await file.read()
-            tmp.write(contents)
-            tmp_path = tmp.name
-
-        parsed = extract_resume_info(tmp_path)
-
-        try:
-            os.unlink(tmp_path)
-        except Exception:
-            # Not critical if cleanup fails
-            pass
+        contents = await read_upload(file, MAX_RESUME_UPLOAD_BYTES)
+        parsed, timings = await parse_resume_cached(contents, raise_errors=False)
+        if timings["cached"]:
+            print(f"[parse-resume] ✓ Stored result for identical upload, skipped parsing")
+        else:
+            print(f"[parse-resume] queue wait {timings['queue_wait_ms']:.1f} ms, parse {timings['parse_ms']:.1f} ms")
+        response.headers["X-Resume-Cache"] = "hit" if timings["cached"] else "miss"
+        response.headers["X-Queue-Wait-Ms"] = f"{timings['queue_wait_ms']:.1f}"
+        response.headers["X-Parse-Ms"] = f"{timings['parse_ms']:.1f}"
 
         # Ensure proper JSON serialization with explicit types
         result = {
             "name": parsed.get("name"),
             "email": parsed.get("email"),
-            "github_links": parsed.get("github_links", [])
+            "github_links": parsed.get("github_links", []),
+            "linkedin": parsed.get("linkedin"),
+            "phone": parsed.get("phone")
         }
         
         return result
 
+    except HTTPException:
+        raise
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail='Resume parsing timed out')
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
+
+@app.post('/parse-resumes')
+async def parse_resumes(files: List[UploadFile] = File(...)):
+    """Parse many resumes at once and stream results back as NDJSON.
+    curl -X POST "http://127.0.0.1:8000/parse-resumes" -F "files=@a.pdf" -F "files=@batch.zip"
+    Accepts any mix of PDFs and zip archives of PDFs. Parsing is spread over a
+    process pool and each line is written as soon as its document finishes, so
+    lines arrive out of upload order (use "index" to match them up):
+
+        {"index": 0, "filename": "a.pdf", "status": "ok", "name": ..., "email": ..., "github_links": [...]}
+        {"index": 1, "filename": "b.pdf", "status": "error", "error": "..."}
+        {"done": true, "total": 2, "failed": 1}
+    """
+    documents, expanded = [], 0
+    for upload in files:
+        filename = upload.filename or "upload"
+        data = await read_upload(upload, MAX_BATCH_UPLOAD_BYTES)
+        if filename.lower().endswith('.zip'):
+            # Archives share the batch's document and byte budget
+            entries = await anyio.to_thread.run_sync(
+                expand_zip, filename, data,
+                MAX_BATCH_FILES - len(documents), MAX_BATCH_UPLOAD_BYTES - expanded
+            )
+            documents.extend(entries)
+            expanded += sum(len(entry) for _, entry in entries if entry is not None)
+        elif filename.lower().endswith('.pdf'):
+            documents.append((filename, data))
+            expanded += len(data)
+        else:
+            documents.append((filename, None))
+
+    if len(documents) > MAX_BATCH_FILES:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {MAX_BATCH_FILES} documents")
+
+    async def ndjson_lines():
+        failed = 0
+        async for result in parse_batch(documents):
+            failed += result["status"] == "error"
+            yield json.dumps(result) + "\n"
+        yield json.dumps({"done": True, "total": len(documents), "failed": failed}) + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
 # --- Gemini API Configuration ---
 # Make sure you set this environment variable
 # export GOOGLE_API_KEY="your_api_key_here"
@@ -104,11 +244,66 @@ except AttributeError:
     raise RuntimeError("GOOGLE_API_KEY environment variable not set.")
 
 
+# "llm" asks Gemini; "fast" answers from the offline question bank in milliseconds
+INTERVIEW_MODE = os.getenv("INTERVIEW_MODE", "llm")
+
+
 class RepoRequest(BaseModel):
     repo_url: str
+    mode: Optional[Literal["llm", "fast"]] = None
+
+
+def llm_unavailable_reason() -> Optional[str]:
+    """Why Gemini should be skipped right now (queue full, breaker open), or None."""
+    if get_llm_limiter().saturated():
+        return "llm_saturated"
+    if not get_llm_breaker().allow():
+        return "breaker_open"
+    return None
+
+
+async def generate_content(model, prompt: str):
+    """Call Gemini inside the limiter slot, bounded by LLM_TIMEOUT_SECONDS, feeding the breaker."""
+    breaker = get_llm_breaker()
+    async with get_llm_limiter().slot():
+        try:
+            with stage("llm"):
+                response = await asyncio.wait_for(model.generate_content_async(prompt), timeout=LLM_TIMEOUT_SECONDS)
+        except Exception:
+            breaker.record_failure()
+            raise
+    breaker.record_success()
+    return response
+
+
+async def iterate_llm_stream(response, budget_seconds: float):
+    """Yield the chunks of a streamed Gemini response, raising TimeoutError once
+    `budget_seconds` have been spent waiting for them.
+
+    Only time blocked on Gemini counts, not time the caller spends between
+    chunks, so a stalled stream fails instead of holding its limiter slot.
+    """
+    chunks = response.__aiter__()
+    while True:
+        waited = time.perf_counter()
+        try:
+            chunk = await asyncio.wait_for(anext(chunks), timeout=max(budget_seconds, 0))
+        except StopAsyncIteration:
+            return
+        budget_seconds -= time.perf_counter() - waited
+        yield chunk
+
+# Concurrent requests for the same repo share one in-flight analysis
+analysis_flight = SingleFlight("analysis")
+
+
+def analysis_flight_key(kind: str, owner: str, repo: str) -> tuple:
+    # GitHub owner/repo names are case-insensitive
+    return (kind, owner.lower(), repo.lower())
+
 
 @app.post("/generate-questions")
-def generate_questions(data: RepoRequest):
+async def generate_questions(data: RepoRequest):
     try:
         repo_url = data.repo_url
         print(f"[generate-questions] Received request for: {repo_url}")
@@ -116,73 +311,100 @@ def generate_questions(data: RepoRequest):
         owner, repo = extract_owner_repo(repo_url)
         print(f"[generate-questions] Extracted owner: {owner}, repo: {repo}")
         
-        # Step 1: Fetch repo contents
-        readme_content = fetch_file_content(owner, repo, "README.md")
-        #key_files = fetch_key_files(owner, repo)
+        return await analysis_flight.do(
+            analysis_flight_key("questions", owner, repo),
+            lambda: analyze_repo_questions(owner, repo, repo_url)
+        )
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        # URL parsing error
+        print(f"[generate-questions] ValueError: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"Invalid GitHub URL: {str(e)}")
+    except Exception as e:
+        # Catch potential Gemini API errors
+        print(f"[generate-questions] Exception: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error generating questions: {str(e)}")
 
-        combined_text = readme_content 
 
-        # Step 2: Clean text
-        cleaned_text = BeautifulSoup(combined_text, "html.parser").get_text()
+async def analyze_repo_questions(owner: str, repo: str, repo_url: str) -> dict:
+    """Fetch the README and generate free-form questions, using the analysis cache."""
+    # Step 1: Fetch repo contents (conditional requests, 304 when unchanged)
+    cache_key, cached, context = await fetch_repo_context(owner, repo, f"questions/{model_name('questions')}")
+    if cached:
+        print(f"[generate-questions] ✓ Cache hit for {owner}/{repo}")
+        return cached
+
+    # Step 2: README (cleaned) + key source files, packed into the token budget
+    cleaned_text = context["text"]
+    
+    # If no content fetched, generate fallback questions
+    if not cleaned_text.strip():
+        print(f"⚠️  [generate-questions] No content fetched for {owner}/{repo}")
+        print(f"⚠️  This could be due to:")
+        print(f"   - Private repository (needs authentication)")
+        print(f"   - GitHub API rate limit (add GITHUB_TOKEN to .env)")
+        print(f"   - Repository doesn't exist or is empty")
+        print(f"⚠️  Generating fallback questions...")
         
-        # We can use a much larger context with Gemini 1.5
-        context_limit = 500000 
+        # Use fallback context
+        cleaned_text = f"""
+        GitHub Repository: {owner}/{repo}
+        URL: {repo_url}
         
-        # If no content fetched, generate fallback questions
-        if not cleaned_text.strip():
-            print(f"⚠️  [generate-questions] No content fetched for {owner}/{repo}")
-            print(f"⚠️  This could be due to:")
-            print(f"   - Private repository (needs authentication)")
-            print(f"   - GitHub API rate limit (add GITHUB_TOKEN to .env)")
-            print(f"   - Repository doesn't exist or is empty")
-            print(f"⚠️  Generating fallback questions...")
-            
-            # Use fallback context
-            cleaned_text = f"""
-            GitHub Repository: {owner}/{repo}
-            URL: {repo_url}
-            
-            Note: Unable to fetch repository contents. This may be a private repository or 
-            the GitHub API rate limit has been reached. Generating general project questions.
-            """
+        Note: Unable to fetch repository contents. This may be a private repository or 
+        the GitHub API rate limit has been reached. Generating general project questions.
+        """
 
-        # Step 3: --- Swapped to Gemini ---
-        
-        # Instantiate the model
-        # Use 'gemini-1.5-pro' for the highest quality analysis
-        # Use 'gemini-1.5-flash' for faster, cheaper responses
-        model = genai.GenerativeModel('gemini-2.5-flash')
+    # Step 3: --- Swapped to Gemini ---
+    
+    # Shared model instance (GEMINI_QUESTIONS_MODEL to override)
+    # Use 'gemini-1.5-pro' for the highest quality analysis
+    # Use 'gemini-1.5-flash' for faster, cheaper responses
+    model = get_model("questions")
 
-        # Generate the new, detailed prompt
-        prompt = create_detailed_prompt(cleaned_text[:context_limit])
+    # Gemini unavailable: answer from the question bank in the same numbered-list format
+    unavailable = llm_unavailable_reason()
+    if unavailable:
+        print(f"⚡ [generate-questions] Skipping Gemini ({unavailable}), using the question bank")
+        FALLBACKS.inc(unavailable)
+        with stage("question_bank"):
+            bank = get_question_bank().generate(owner, repo, cleaned_text, context["files"])
+        numbered = "\n".join(f"{i}. {q['question']}" for i, q in enumerate(bank["questions"], start=1))
+        return {"questions": numbered, "source": "question_bank"}
 
-        # Generate content
-        print(f"[generate-questions] Calling Gemini API...")
-        response = model.generate_content(prompt)
+    # Generate the new, detailed prompt
+    with stage("prompt_build"):
+        prompt = create_detailed_prompt(cleaned_text)
 
-        # Extract the text
-        questions = response.text.strip()
-        print(f"[generate-questions] ✓ Generated {len(questions)} characters of questions")
-        
-        return {"questions": questions}
+    # Generate content
+    print(f"[generate-questions] Calling Gemini API...")
+    response = await generate_content(model, prompt)
 
-    except ValueError as e:
-        # URL parsing error
-        print(f"[generate-questions] ValueError: {str(e)}")
-        raise HTTPException(status_code=400, detail=f"Invalid GitHub URL: {str(e)}")
-    except Exception as e:
-        # Catch potential Gemini API errors (e.g., safety blocks)
-        print(f"[generate-questions] Exception: {str(e)}")
-        if 'response' in locals() and hasattr(response, 'prompt_feedback') and not response.parts:
-             raise HTTPException(status_code=500, detail=f"Content generation blocked. Feedback: {response.prompt_feedback}")
-        raise HTTPException(status_code=500, detail=f"Error generating questions: {str(e)}")
+    # e.g. safety blocks
+    if not response.parts:
+        raise HTTPException(status_code=500, detail=f"Content generation blocked. Feedback: {response.prompt_feedback}")
+
+    # Extract the text
+    questions = response.text.strip()
+    print(f"[generate-questions] ✓ Generated {len(questions)} characters of questions")
+    
+    result = {"questions": questions}
+    if cache_key:
+        get_analysis_cache().set(cache_key, result)
+    return result
 
 
 @app.post("/generate-project-interview")
-def generate_project_interview(data: RepoRequest):
+async def generate_project_interview(data: RepoRequest):
     """
     Generate structured interview questions for voice/project interview module.
     Returns JSON with metadata for each question (category, difficulty, key points).
+    Identical concurrent requests share one analysis.
+    With "mode": "fast" (or INTERVIEW_MODE=fast) Gemini is skipped and the
+    questions come from the offline question bank, ranked by the stack
+    detected in the README; a cached Gemini analysis is still preferred.
     """
     try:
         repo_url = data.repo_url
@@ -191,23 +413,69 @@ def generate_project_interview(data: RepoRequest):
         print(f"{'='*60}")
         owner, repo = extract_owner_repo(repo_url)
         print(f"[Step 1] Owner: {owner}, Repo: {repo}")
-        
-        # Step 1: Fetch repo contents
-        print(f"[Step 2] Fetching README.md...")
-        readme_content = fetch_file_content(owner, repo, "README.md")
-        print(f"[Step 2] README length: {len(readme_content)} characters")
-        
-        key_files = {}  # Initialize as empty dict to avoid NameError
-        # key_files = fetch_key_files(owner, repo)  # Uncomment if you want to fetch source files
 
-        combined_text = readme_content 
+        if (data.mode or INTERVIEW_MODE) == "fast":
+            return {**await fast_project_interview(owner, repo), 'repo_url': repo_url}
 
-        # Step 2: Clean text
-        print(f"[Step 3] Cleaning HTML from README...")
-        cleaned_text = BeautifulSoup(combined_text, "html.parser").get_text()
-        print(f"[Step 3] Cleaned text length: {len(cleaned_text)} characters")
-        
-        context_limit = 500000 
+        result = await analysis_flight.do(
+            analysis_flight_key("project-interview", owner, repo),
+            lambda: analyze_project_interview(owner, repo, repo_url)
+        )
+        return {**result, 'repo_url': repo_url}
+
+    except ValueError as e:
+        print(f"\n❌ Validation Error: {str(e)}")
+        print(f"⚠️  Returning fallback questions")
+        return generate_fallback_questions('unknown', 'unknown', reason="invalid_url")
+    except Exception as e:
+        print(f"\n❌ Unexpected Error: {str(e)}")
+        print(f"Error type: {type(e).__name__}")
+        print(f"⚠️  Returning fallback questions")
+        return generate_fallback_questions(
+            owner if 'owner' in locals() else 'unknown', 
+            repo if 'repo' in locals() else 'unknown'
+        )
+
+
+async def fast_project_interview(owner: str, repo: str) -> dict:
+    """Low-latency mode: the cached Gemini analysis if there is one, else the question bank."""
+    _, cached, context = await fetch_repo_context(
+        owner, repo, f"project-interview/{model_name('project_interview')}"
+    )
+    if cached:
+        print(f"[fast] ✓ Cache hit for {owner}/{repo}")
+        return cached
+    with stage("question_bank"):
+        result = get_question_bank().generate(owner, repo, context["text"], context["files"])
+    print(f"[fast] ✓ {len(result['questions'])} questions from the question bank in {result['generation_ms']} ms "
+          f"(detected: {', '.join(result['detected_stack']) or 'nothing'})")
+    return result
+
+
+async def analyze_project_interview(owner: str, repo: str, repo_url: str) -> dict:
+    """Fetch the README and generate structured questions, falling back to the question bank on failure."""
+    context = None
+
+    def fallback(reason: str) -> dict:
+        return generate_fallback_questions(
+            owner, repo, reason=reason,
+            context=context["text"] if context else None,
+            files=context["files"] if context else None
+        )
+
+    try:
+        # Step 1: Fetch repo contents
+        print(f"[Step 2] Listing repository tree...")
+        cache_key, cached, context = await fetch_repo_context(
+            owner, repo, f"project-interview/{model_name('project_interview')}"
+        )
+        if cached:
+            print(f"[Step 2] ✓ Cache hit for {owner}/{repo}, skipping Gemini")
+            return cached
+
+        # Step 2: README (cleaned) + key source files, packed into the token budget
+        cleaned_text = context["text"]
+        print(f"[Step 3] Context: {len(context['files'])} files, ~{context['tokens']} tokens")
         
         # If no content, provide minimal context
         if not cleaned_text.strip():
@@ -216,30 +484,23 @@ def generate_project_interview(data: RepoRequest):
         else:
             print(f"✓ Successfully fetched repository content")
 
+        unavailable = llm_unavailable_reason()
+        if unavailable:
+            print(f"⚡ Skipping Gemini ({unavailable}), using the question bank")
+            return fallback(unavailable)
+
         # Step 3: Generate structured questions with Gemini
-        print(f"[Step 4] Initializing Gemini model...")
-        model = genai.GenerativeModel(
-            'gemini-1.5-flash',  # Use stable model instead of experimental
-            generation_config={
-                'temperature': 0.7,
-                'response_mime_type': 'application/json'
-            },
-            # Add safety settings to reduce blocks
-            safety_settings={
-                'HARASSMENT': 'BLOCK_NONE',
-                'HATE_SPEECH': 'BLOCK_NONE',
-                'SEXUALLY_EXPLICIT': 'BLOCK_NONE',
-                'DANGEROUS_CONTENT': 'BLOCK_NONE'
-            }
-        )
+        print(f"[Step 4] Using shared Gemini model {model_name('project_interview')}...")
+        model = get_model("project_interview")
 
-        prompt = create_structured_interview_prompt(cleaned_text[:context_limit])
+        with stage("prompt_build"):
+            prompt = create_structured_interview_prompt(cleaned_text)
         
         print(f"[Step 5] Calling Gemini API with {len(prompt)} character prompt...")
 
         # Generate content with better error handling
         try:
-            response = model.generate_content(prompt)
+            response = await generate_content(model, prompt)
             
             # Check if content was blocked
             if not response.parts:
@@ -248,8 +509,7 @@ def generate_project_interview(data: RepoRequest):
                 print(f"⚠️  Using fallback questions...")
                 
                 # Generate fallback questions
-                fallback_questions = generate_fallback_questions(owner, repo)
-                return fallback_questions
+                return fallback("blocked")
             
             print(f"✓ Gemini API call successful")
             print(f"[Step 6] Response length: {len(response.text)} characters")
@@ -258,13 +518,12 @@ def generate_project_interview(data: RepoRequest):
             print(f"❌ Gemini API error: {str(gemini_error)}")
             print(f"Error type: {type(gemini_error).__name__}")
             print(f"⚠️  Using fallback questions...")
-            # Generate fallback questions
-            fallback_questions = generate_fallback_questions(owner, repo)
-            return fallback_questions
+            return fallback("llm_timeout" if isinstance(gemini_error, asyncio.TimeoutError) else "llm_error")
         
         # Parse JSON response
         print(f"[Step 7] Parsing JSON response...")
-        questions_data = json.loads(response.text)
+        with stage("json_parse"):
+            questions_data = json.loads(response.text)
         
         # Validate structure
         if not isinstance(questions_data, dict) or 'questions' not in questions_data:
@@ -278,8 +537,12 @@ def generate_project_interview(data: RepoRequest):
         # Add repo metadata
         questions_data['repo_url'] = repo_url
         questions_data['repo_name'] = f"{owner}/{repo}"
-        questions_data['analyzed_files'] = list(key_files.keys()) if key_files else []
+        questions_data['analyzed_files'] = context["files"]
+        questions_data['source'] = "gemini"
         
+        if cache_key:
+            get_analysis_cache().set(cache_key, questions_data)
+
         print(f"[Step 8] ✅ Successfully generated {len(questions_data['questions'])} questions for {repo}")
         print(f"{'='*60}\n")
         return questions_data
@@ -289,32 +552,336 @@ def generate_project_interview(data: RepoRequest):
         print(f"Raw response: {response.text[:500] if 'response' in locals() else 'No response'}...")
         print(f"⚠️  Returning fallback questions")
         # Return fallback instead of error
-        fallback_questions = generate_fallback_questions(owner if 'owner' in locals() else 'unknown', 
-                                                         repo if 'repo' in locals() else 'unknown')
-        return fallback_questions
+        return fallback("json_error")
     except ValueError as e:
         print(f"\n❌ Validation Error: {str(e)}")
         print(f"⚠️  Returning fallback questions")
-        fallback_questions = generate_fallback_questions(owner if 'owner' in locals() else 'unknown', 
-                                                         repo if 'repo' in locals() else 'unknown')
-        return fallback_questions
+        return fallback("invalid_response")
     except Exception as e:
         print(f"\n❌ Unexpected Error: {str(e)}")
         print(f"Error type: {type(e).__name__}")
         print(f"⚠️  Returning fallback questions")
-        fallback_questions = generate_fallback_questions(
-            owner if 'owner' in locals() else 'unknown', 
-            repo if 'repo' in locals() else 'unknown'
+        return fallback("error")
+
+
+@app.post("/generate-project-interview/stream")
+async def generate_project_interview_stream(data: RepoRequest):
+    """
+    Streaming variant of /generate-project-interview, as NDJSON.
+    Gemini's output is parsed incrementally and each question is written as
+    soon as its JSON object is complete, so the interview can start on
+    question 1 while the rest are still being generated:
+
+        {"type": "meta", "repo_name": "owner/repo", "repo_url": ..., "analyzed_files": [...], "cached": false}
+        {"type": "question", "index": 0, "question": {"question": ..., "category": ..., ...}}
+        ...
+        {"type": "done", "total": 5, "source": "gemini"}
+
+    "source" is "cache" on an analysis cache hit (shared with the buffered
+    endpoint), "question_bank" in fast mode, "fallback" when Gemini was
+    unavailable or produced no usable question, and "partial" when it
+    failed midway and the remaining slots were filled from the question bank.
+    """
+    repo_url = data.repo_url
+    print(f"[generate-project-interview/stream] 🚀 Processing: {repo_url}")
+    try:
+        owner, repo = extract_owner_repo(repo_url)
+    except ValueError as e:
+        print(f"\n❌ Validation Error: {str(e)}")
+        owner, repo = 'unknown', 'unknown'
+
+    async def ndjson_lines():
+        async for event in stream_project_interview(owner, repo, repo_url, data.mode or INTERVIEW_MODE):
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+async def stream_project_interview(owner: str, repo: str, repo_url: str, mode: str = "llm"):
+    """Yield the NDJSON events of /generate-project-interview/stream."""
+    kind = f"project-interview/{model_name('project_interview')}"
+    repo_name = f"{owner}/{repo}"
+    cache_key, cached, context = None, None, None
+    if owner != 'unknown':
+        try:
+            cache_key, cached, context = await fetch_repo_context(owner, repo, kind)
+        except Exception as e:
+            print(f"❌ Error fetching {repo_name}: {str(e)}")
+
+    if cached:
+        print(f"[stream] ✓ Cache hit for {repo_name}, skipping Gemini")
+        yield {"type": "meta", "repo_name": repo_name, "repo_url": repo_url,
+               "analyzed_files": cached.get("analyzed_files", []), "cached": True}
+        for index, question in enumerate(cached["questions"]):
+            yield {"type": "question", "index": index, "question": question}
+        yield {"type": "done", "total": len(cached["questions"]), "source": "cache"}
+        return
+
+    analyzed_files = context["files"] if context else []
+    yield {"type": "meta", "repo_name": repo_name, "repo_url": repo_url,
+           "analyzed_files": analyzed_files, "cached": False}
+
+    questions = []
+    failure = None
+    skip_reason = None
+    if context is not None:
+        skip_reason = "fast" if mode == "fast" else llm_unavailable_reason()
+    if context is not None and skip_reason is None:
+        cleaned_text = context["text"]
+        if not cleaned_text.strip():
+            cleaned_text = f"GitHub Repository: {repo_name}\nNo README or source files could be accessed. Generate general software engineering questions."
+            print(f"⚠️  WARNING: No content fetched for {repo_name}, using fallback context")
+        with stage("prompt_build"):
+            prompt = create_structured_interview_prompt(cleaned_text)
+
+        streamer = JsonArrayStreamer("questions")
+        print(f"[stream] Streaming from Gemini with {len(prompt)} character prompt...")
+        breaker = get_llm_breaker()
+        try:
+            async with get_llm_limiter().slot():
+                with stage("llm"):
+                    started = time.perf_counter()
+                    response = await asyncio.wait_for(
+                        get_model("project_interview").generate_content_async(prompt, stream=True),
+                        timeout=LLM_TIMEOUT_SECONDS
+                    )
+                    remaining = LLM_TIMEOUT_SECONDS - (time.perf_counter() - started)
+                    async for chunk in iterate_llm_stream(response, remaining):
+                        try:
+                            text = chunk.text
+                        except ValueError:
+                            # No text parts, e.g. a chunk stopped by the safety filters
+                            continue
+                        for question in streamer.feed(text):
+                            if not isinstance(question, dict) or not question.get("question"):
+                                continue
+                            if not questions:
+                                observe_stage("llm_first_question", time.perf_counter() - started)
+                                print(f"[stream] ✓ First question after {(time.perf_counter() - started) * 1000:.0f} ms")
+                            yield {"type": "question", "index": len(questions), "question": question}
+                            questions.append(question)
+            breaker.record_success()
+        except Exception as e:
+            print(f"❌ Gemini streaming error: {str(e)}")
+            print(f"Error type: {type(e).__name__}")
+            breaker.record_failure()
+            failure = e
+
+    context_text = context["text"] if context else None
+    if not questions:
+        if skip_reason == "fast":
+            with stage("question_bank"):
+                fallback = get_question_bank().generate(owner, repo, context_text, analyzed_files)
+            source = "question_bank"
+        else:
+            print(f"⚠️  Returning fallback questions")
+            reason = skip_reason or ("stream_error" if failure else "stream_empty")
+            fallback = generate_fallback_questions(owner, repo, reason=reason, context=context_text, files=analyzed_files)
+            source = "fallback"
+        for index, question in enumerate(fallback["questions"]):
+            yield {"type": "question", "index": index, "question": question}
+        yield {"type": "done", "total": len(fallback["questions"]), "source": source}
+        return
+
+    if failure is not None:
+        # Keep the interview length the client expects; don't cache a partial set
+        fallback = generate_fallback_questions(
+            owner, repo, reason="stream_partial", context=context_text, files=analyzed_files
         )
-        return fallback_questions
+        for question in fallback["questions"][len(questions):]:
+            yield {"type": "question", "index": len(questions), "question": question}
+            questions.append(question)
+        yield {"type": "done", "total": len(questions), "source": "partial"}
+        return
+
+    if cache_key:
+        get_analysis_cache().set(cache_key, {
+            "questions": questions,
+            "repo_url": repo_url,
+            "repo_name": repo_name,
+            "analyzed_files": analyzed_files,
+        })
+    print(f"[stream] ✅ Streamed {len(questions)} questions for {repo_name}")
+    yield {"type": "done", "total": len(questions), "source": "gemini"}
+
+
+RESUME_INTERVIEW_MAX_REPOS = int(os.getenv("RESUME_INTERVIEW_MAX_REPOS", "5"))
+RESUME_INTERVIEW_CONCURRENCY = int(os.getenv("RESUME_INTERVIEW_CONCURRENCY", "3"))
+RESUME_INTERVIEW_MAX_QUESTIONS = int(os.getenv("RESUME_INTERVIEW_MAX_QUESTIONS", "10"))
+
+
+@app.post("/resume-to-interview")
+async def resume_to_interview(file: UploadFile = File(...), mode: Optional[Literal["llm", "fast"]] = None):
+    """Resume PDF in, interview questions for every linked GitHub repo out, as NDJSON.
+    curl -N -X POST "http://127.0.0.1:8000/resume-to-interview" -F "file=@resume.pdf"
+    Linked repos (at most RESUME_INTERVIEW_MAX_REPOS) are analyzed concurrently,
+    RESUME_INTERVIEW_CONCURRENCY at a time, through the same cached and
+    coalesced path as /generate-project-interview, so several projects cost
+    about one analysis of wall-clock time. Lines are written as work completes:
 
+        {"type": "resume", "name": ..., "email": ..., "github_links": [...], "repos": ["owner/repo", ...], "skipped_links": [...]}
+        {"type": "repo", "repo": "owner/repo", "status": "ok", "source": "gemini", "elapsed_ms": 8123, "questions": [...]}
+        {"type": "done", "questions": [...], "total": 10, "duplicates": 2, "failed": 0, "elapsed_ms": 9050}
 
-def generate_fallback_questions(owner: str, repo: str):
+    "repo" lines arrive in completion order and carry only questions not
+    already sent for another repo. Their "source" is "gemini", "question_bank"
+    (?mode=fast) or "fallback" (Gemini failed or was skipped; see
+    "fallback_reason"). "done" lists the merged questions,
+    interleaved across repos in resume order and capped at
+    RESUME_INTERVIEW_MAX_QUESTIONS; every question has a "repo" field.
+    ?mode=fast answers from the offline question bank.
     """
-    Generate generic but useful interview questions when Gemini fails or content is blocked.
-    These questions are still valuable for project interviews.
+    if not file.filename or not file.filename.lower().endswith('.pdf'):
+        raise HTTPException(status_code=400, detail='Only PDF uploads are supported')
+
+    started = time.perf_counter()
+    contents = await read_upload(file, MAX_RESUME_UPLOAD_BYTES)
+    try:
+        parsed, _ = await parse_resume_cached(contents, raise_errors=False)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail='Resume parsing timed out')
+
+    # Repo links only, deduplicated (GitHub names are case-insensitive), in resume order
+    repos, skipped, seen = [], [], set()
+    for link in parsed.get("github_links", []):
+        owner_repo = github_repo_from_link(link)
+        if owner_repo is None:
+            skipped.append(link)
+            continue
+        key = (owner_repo[0].lower(), owner_repo[1].lower())
+        if key in seen:
+            continue
+        seen.add(key)
+        if len(repos) >= RESUME_INTERVIEW_MAX_REPOS:
+            skipped.append(link)
+        else:
+            repos.append(owner_repo)
+    repo_names = [f"{owner}/{repo}" for owner, repo in repos]
+    interview_mode = mode or INTERVIEW_MODE
+    print(f"[resume-to-interview] 🚀 {len(repos)} repos: {', '.join(repo_names) or 'none'}")
+
+    async def analyze(semaphore: asyncio.Semaphore, owner: str, repo: str):
+        async with semaphore:
+            repo_started = time.perf_counter()
+            try:
+                if interview_mode == "fast":
+                    result = await fast_project_interview(owner, repo)
+                else:
+                    repo_url = f"https://github.com/{owner}/{repo}"
+                    result = await analysis_flight.do(
+                        analysis_flight_key("project-interview", owner, repo),
+                        lambda: analyze_project_interview(owner, repo, repo_url)
+                    )
+                return owner, repo, result, None, time.perf_counter() - repo_started
+            except Exception as e:
+                return owner, repo, None, e, time.perf_counter() - repo_started
+
+    async def ndjson_lines():
+        yield json.dumps({
+            "type": "resume",
+            "name": parsed.get("name"),
+            "email": parsed.get("email"),
+            "github_links": parsed.get("github_links", []),
+            "repos": repo_names,
+            "skipped_links": skipped,
+        }) + "\n"
+
+        merger = QuestionMerger(repo_names)
+        semaphore = asyncio.Semaphore(RESUME_INTERVIEW_CONCURRENCY)
+        tasks = [asyncio.create_task(analyze(semaphore, owner, repo)) for owner, repo in repos]
+        failed, analysis_seconds = 0, 0.0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                owner, repo, result, error, seconds = await next_done
+                analysis_seconds += seconds
+                name = f"{owner}/{repo}"
+                if error is not None:
+                    failed += 1
+                    print(f"❌ [resume-to-interview] {name} failed: {str(error)}")
+                    yield json.dumps({"type": "repo", "repo": name, "status": "error", "error": str(error),
+                                      "elapsed_ms": round(seconds * 1000)}) + "\n"
+                    continue
+                kept = merger.add(name, result.get("questions", []))
+                event = {
+                    "type": "repo",
+                    "repo": name,
+                    "status": "ok",
+                    # Analyses cached before results carried a source all came from Gemini
+                    "source": result.get("source", "gemini"),
+                    "analyzed_files": result.get("analyzed_files", []),
+                    "elapsed_ms": round(seconds * 1000),
+                    "questions": kept,
+                }
+                if result.get("fallback_reason"):
+                    event["fallback_reason"] = result["fallback_reason"]
+                yield json.dumps(event) + "\n"
+        finally:
+            # Client gone: stop waiting (shared analyses keep running and still fill the cache)
+            for task in tasks:
+                task.cancel()
+
+        questions = merger.merged(RESUME_INTERVIEW_MAX_QUESTIONS)
+        elapsed = time.perf_counter() - started
+        print(f"[resume-to-interview] ✅ {len(repos)} repos in {elapsed * 1000:.0f} ms wall clock "
+              f"({analysis_seconds * 1000:.0f} ms of analysis), {len(questions)} questions")
+        done = {
+            "type": "done",
+            "questions": questions,
+            "total": len(questions),
+            "duplicates": merger.duplicates,
+            "failed": failed,
+            "elapsed_ms": round(elapsed * 1000),
+        }
+        if not repos:
+            done["error"] = "No GitHub repository links found in the resume"
+        yield json.dumps(done) + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+async def fetch_repo_context(owner: str, repo: str, cache_kind: str):
+    """Return (cache_key, cached_result, context); context is None on a cache hit.
+
+    The analysis is keyed by the repo's tree SHA, so any commit invalidates it
+    and a hit costs one conditional tree request. Without a tree (private repo,
+    rate limit) it falls back to the README's SHA.
+    """
+    client = get_github_client()
+    with stage("github_tree"):
+        tree = await client.fetch_tree(owner, repo)
+    cache_key = None
+    if tree is not None:
+        cache_key = analysis_cache_key(cache_kind, owner, repo, tree["sha"])
+        cached = get_analysis_cache().get(cache_key) if cache_key else None
+        if cached:
+            return cache_key, cached, None
+
+    context = await build_repo_context(client, owner, repo, tree)
+    if tree is None:
+        cache_key = analysis_cache_key(cache_kind, owner, repo, context["readme_sha"])
+        cached = get_analysis_cache().get(cache_key) if cache_key else None
+        if cached:
+            return cache_key, cached, None
+    return cache_key, None, context
+
+
+def generate_fallback_questions(owner: str, repo: str, reason: str = "error",
+                                context: Optional[str] = None, files: Optional[List[str]] = None):
+    """
+    Generate useful interview questions when Gemini fails or content is blocked.
+    They come from the offline question bank, ranked by the stack detected in
+    `context` and `files`; the fixed generic set below is the last resort.
+    The result has "source": "fallback" and "fallback_reason": `reason`, which
+    also labels the sarthi_fallbacks_total counter on /metrics.
     """
-    print(f"[Fallback] Generating generic questions for {owner}/{repo}")
+    print(f"[Fallback] Generating question bank questions for {owner}/{repo}")
+    FALLBACKS.inc(reason)
+    try:
+        with stage("question_bank"):
+            result = get_question_bank().generate(owner, repo, context or "", files)
+        return {**result, "source": "fallback", "fallback_reason": reason}
+    except Exception as e:
+        print(f"⚠️  Question bank unavailable ({str(e)}), using generic questions")
     
     return {
         "questions": [
@@ -382,7 +949,9 @@ def generate_fallback_questions(owner: str, repo: str):
         "repo_url": f"https://github.com/{owner}/{repo}",
         "repo_name": f"{owner}/{repo}",
         "analyzed_files": [],
-        "note": "Generic questions generated due to content safety restrictions or API error"
+        "note": "Generic questions generated due to content safety restrictions or API error",
+        "source": "fallback",
+        "fallback_reason": reason
     }
 
 
@@ -493,81 +1062,4 @@ def extract_owner_repo(url: str):
     parts = url.strip("/").split("/")
     if len(parts) < 2:
         raise ValueError("Invalid GitHub URL format. Expected '.../owner/repo'")
-    return parts[-2], parts[-1]
-
-
-def fetch_file_content(owner, repo, path):
-    api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
-    # Add a token if you have one to avoid rate limiting
-    headers = {}
-    github_token = os.getenv('GITHUB_TOKEN')
-    if github_token and github_token != 'your_github_token_here':
-        headers["Authorization"] = f"token {github_token}"
-    else:
-        # Without token, we have 60 requests/hour per IP
-        print("⚠️  No GitHub token configured - using unauthenticated requests (60/hour limit)")
-    
-    try:
-        r = requests.get(api_url, headers=headers, timeout=10)
-        
-        if r.status_code == 200:
-            data = r.json()
-            if "content" in data:
-                import base64
-                decoded = base64.b64decode(data["content"]).decode("utf-8", errors="ignore")
-                print(f"✓ Fetched {path}: {len(decoded)} characters")
-                return decoded
-        elif r.status_code == 401:
-            print(f"✗ Authentication failed for {path}. Check GITHUB_TOKEN or repo access.")
-        elif r.status_code == 404:
-            print(f"✗ File not found: {path}")
-        elif r.status_code == 403:
-            print(f"✗ Rate limit exceeded for {path}. Add GITHUB_TOKEN to .env")
-        else:
-            print(f"✗ Failed to fetch {path}: Status {r.status_code}")
-    except Exception as e:
-        print(f"✗ Error fetching {path}: {str(e)}")
-    
-    return ""
-
-
-def fetch_key_files(owner, repo):
-    """Fetch 3-5 main source files (like app.py, main.js, etc.)"""
-    api_url = f"https://api.github.com/repos/{owner}/{repo}/contents"
-    headers = {}
-    github_token = os.getenv('GITHUB_TOKEN')
-    if github_token and github_token != 'your_github_token_here':
-        headers["Authorization"] = f"token {github_token}"
-
-    r = requests.get(api_url, headers=headers)
-    key_files = {}
-
-    if r.status_code == 200:
-        files = r.json()
-        
-        # Prioritize common main files
-        priority_files = [
-            "main.py", "app.py", "server.js", "index.js", "index.ts", 
-            "main.js", "app.js", "main.cpp", "main.java", "main.go"
-        ]
-        
-        for file in files:
-            if file["type"] == "file" and file["name"] in priority_files:
-                content = fetch_file_content(owner, repo, file["path"])
-                if content:
-                    key_files[file["name"]] = content
-                if len(key_files) >= 3:
-                    break
-        
-        # If no priority files found, grab any source files (up to 5)
-        if len(key_files) < 3:
-            for file in files:
-                if file["type"] == "file" and file["name"].endswith((".py", ".js", ".ts", ".jsx", ".tsx", ".cpp", ".java", ".go", ".rs")):
-                    if file["name"] not in key_files:
-                        content = fetch_file_content(owner, repo, file["path"])
-                        if content:
-                            key_files[file["name"]] = content
-                        if len(key_files) >= 5:
-                            break
-    
-    return key_files
\ No newline at end of file
+    return parts[-2], parts[-1].removesuffix(".git")
@@ -0,0 +1,185 @@
+"""Optional audio preprocessing before STT upload: silence trimming, 16 kHz mono, compact re-encode."""
+
+import array
+import io
+import os
+import shutil
+import subprocess
+import time
+import wave
+from typing import Dict, Optional, Tuple
+
+from src.streaming_stt import FRAME_MS, pcm16_rms, pcm16_to_wav
+
+try:
+    # Fast C paths for mixing/resampling/RMS; removed from the stdlib in 3.13
+    import audioop
+except ImportError:
+    audioop = None
+
+
+TARGET_SAMPLE_RATE = 16000
+STT_VAD_RMS = float(os.getenv("STT_VAD_RMS", "500"))
+STT_VAD_PAD_MS = int(os.getenv("STT_VAD_PAD_MS", "150"))
+STT_MAX_PAUSE_MS = int(os.getenv("STT_MAX_PAUSE_MS", "700"))
+FFMPEG = shutil.which("ffmpeg")
+
+
+def _frame_rms(frame: bytes) -> float:
+    return audioop.rms(frame, 2) if audioop else pcm16_rms(frame)
+
+
+def _to_mono(pcm: bytes, channels: int) -> bytes:
+    if channels == 1:
+        return pcm
+    if audioop and channels == 2:
+        return audioop.tomono(pcm, 2, 0.5, 0.5)
+    samples = array.array('h')
+    samples.frombytes(pcm)
+    mono = array.array('h', (
+        sum(samples[i:i + channels]) // channels for i in range(0, len(samples), channels)
+    ))
+    return mono.tobytes()
+
+
+def _resample(pcm: bytes, rate: int, target: int = TARGET_SAMPLE_RATE) -> bytes:
+    if rate == target:
+        return pcm
+    if audioop:
+        return audioop.ratecv(pcm, 2, 1, rate, target, None)[0]
+    # Nearest-sample fallback; adequate for speech recognition input
+    samples = array.array('h')
+    samples.frombytes(pcm)
+    step = rate / target
+    resampled = array.array('h', (samples[int(i * step)] for i in range(int(len(samples) / step))))
+    return resampled.tobytes()
+
+
+def _decode_wav(content: bytes) -> Optional[Tuple[bytes, int]]:
+    """16-bit PCM WAV via the stdlib; None for float, 8/24-bit or WAVE_FORMAT_EXTENSIBLE files."""
+    try:
+        with wave.open(io.BytesIO(content), 'rb') as wav:
+            channels, rate = wav.getnchannels(), wav.getframerate()
+            if wav.getsampwidth() != 2 or channels < 1 or rate < 1:
+                return None
+            # Streamed WAVs often carry a bogus frame count, so read to EOF
+            pcm = wav.readframes(2 ** 31 - 1)
+    except (wave.Error, EOFError):
+        return None
+    pcm = pcm[:len(pcm) - len(pcm) % (2 * channels)]
+    return _resample(_to_mono(pcm, channels), rate), TARGET_SAMPLE_RATE
+
+
+def _run_ffmpeg(args: list, content: bytes) -> Optional[bytes]:
+    """ffmpeg's stdout, or None if it failed, produced nothing or took longer than 30 s."""
+    try:
+        result = subprocess.run([FFMPEG, "-hide_banner", "-loglevel", "error", *args],
+                                input=content, capture_output=True, timeout=30)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        print(f"⚠️  ffmpeg failed: {str(e)}")
+        return None
+    if result.returncode != 0 or not result.stdout:
+        return None
+    return result.stdout
+
+
+def decode_to_pcm(content: bytes) -> Optional[Tuple[bytes, int]]:
+    """Decode audio to 16-bit mono PCM at 16 kHz; None if the format can't be decoded here.
+
+    16-bit PCM WAV is decoded natively; anything else (other WAV encodings,
+    webm, mp3, m4a...) needs ffmpeg.
+    """
+    if content[:4] == b"RIFF" and content[8:12] == b"WAVE":
+        decoded = _decode_wav(content)
+        if decoded is not None:
+            return decoded
+
+    if FFMPEG:
+        pcm = _run_ffmpeg(
+            ["-i", "pipe:0", "-ac", "1", "-ar", str(TARGET_SAMPLE_RATE), "-f", "s16le", "pipe:1"],
+            content,
+        )
+        if pcm is not None:
+            return pcm, TARGET_SAMPLE_RATE
+    return None
+
+
+def trim_silence(pcm: bytes, sample_rate: int,
+                 threshold: float = STT_VAD_RMS,
+                 pad_ms: int = STT_VAD_PAD_MS,
+                 max_pause_ms: int = STT_MAX_PAUSE_MS) -> bytes:
+    """Drop leading/trailing silence and shorten inner pauses to `max_pause_ms`."""
+    frame_bytes = sample_rate * FRAME_MS // 1000 * 2
+    frames = [pcm[i:i + frame_bytes] for i in range(0, len(pcm), frame_bytes)]
+    voiced = [_frame_rms(frame) >= threshold for frame in frames]
+    if not any(voiced):
+        return b""
+
+    pad = pad_ms // FRAME_MS
+    max_pause = max_pause_ms // FRAME_MS
+    first = max(0, voiced.index(True) - pad)
+    last = min(len(frames), len(voiced) - voiced[::-1].index(True) + pad)
+
+    kept = []
+    silent_run = 0
+    for frame, is_voiced in zip(frames[first:last], voiced[first:last]):
+        silent_run = 0 if is_voiced else silent_run + 1
+        if silent_run <= max_pause:
+            kept.append(frame)
+    return b"".join(kept)
+
+
+def encode_compact(pcm: bytes, sample_rate: int) -> Tuple[bytes, str, str]:
+    """Return (audio, filename extension, codec); Opus via ffmpeg when available, else WAV."""
+    if FFMPEG:
+        encoded = _run_ffmpeg(
+            ["-f", "s16le", "-ac", "1", "-ar", str(sample_rate), "-i", "pipe:0",
+             "-c:a", "libopus", "-b:a", "24k", "-f", "ogg", "pipe:1"],
+            pcm,
+        )
+        if encoded is not None:
+            return encoded, "ogg", "opus"
+    return pcm16_to_wav(pcm, sample_rate), "wav", "pcm_s16le"
+
+
+def preprocess_audio(filename: str, content: bytes) -> Tuple[str, bytes, Dict]:
+    """Trim, downmix and re-encode audio for upload; CPU-bound, run it off the event loop.
+
+    Returns (filename, content, report). The original is returned unchanged
+    when it can't be decoded or preprocessing wouldn't make it smaller.
+    """
+    started = time.perf_counter()
+    report = {"applied": False, "original_bytes": len(content)}
+
+    decoded = decode_to_pcm(content)
+    if decoded is None:
+        report["reason"] = "unsupported format (install ffmpeg to decode compressed or non-PCM audio)"
+        return filename, content, report
+
+    pcm, rate = decoded
+    trimmed = trim_silence(pcm, rate)
+    original_duration = len(pcm) / (2 * rate)
+    processed_duration = len(trimmed) / (2 * rate)
+    report.update({
+        "original_duration_s": round(original_duration, 3),
+        "processed_duration_s": round(processed_duration, 3),
+        "duration_saved_s": round(original_duration - processed_duration, 3),
+    })
+
+    if not trimmed:
+        report["reason"] = "no speech detected"
+        return filename, content, report
+
+    encoded, extension, codec = encode_compact(trimmed, rate)
+    report["preprocess_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    if len(encoded) >= len(content):
+        report.update({"reason": "re-encoded audio was not smaller", "processed_bytes": len(content), "bytes_saved": 0})
+        return filename, content, report
+
+    report.update({
+        "applied": True,
+        "codec": codec,
+        "processed_bytes": len(encoded),
+        "bytes_saved": len(content) - len(encoded),
+    })
+    return f"{os.path.splitext(filename)[0]}.{extension}", encoded, report
@@ -0,0 +1,269 @@
+"""TTL + LRU caches with pluggable in-memory and on-disk SQLite backends."""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+
+# SQLite files live outside the source tree unless a path is configured
+CACHE_DATA_DIR = os.getenv("CACHE_DATA_DIR", os.path.join(tempfile.gettempdir(), "sarthi_cache"))
+
+DEFAULT_CACHE_BACKEND = os.getenv("REPO_CACHE_BACKEND", "memory")
+DEFAULT_CACHE_PATH = os.getenv("REPO_CACHE_PATH", os.path.join(CACHE_DATA_DIR, "repo_cache.sqlite3"))
+DEFAULT_CACHE_TTL_SECONDS = float(os.getenv("REPO_CACHE_TTL_SECONDS", "86400"))
+DEFAULT_CACHE_MAX_ENTRIES = int(os.getenv("REPO_CACHE_MAX_ENTRIES", "512"))
+
+RESUME_STORE_BACKEND = os.getenv("RESUME_STORE_BACKEND", "tiered")
+RESUME_STORE_PATH = os.getenv("RESUME_STORE_PATH", os.path.join(CACHE_DATA_DIR, "resume_store.sqlite3"))
+RESUME_STORE_MAX_ENTRIES = int(os.getenv("RESUME_STORE_MAX_ENTRIES", "20000"))
+RESUME_STORE_MEMORY_ENTRIES = int(os.getenv("RESUME_STORE_MEMORY_ENTRIES", "1024"))
+RESUME_STORE_TTL_SECONDS = float(os.getenv("RESUME_STORE_TTL_SECONDS", str(30 * 86400)))
+
+
+class _CacheStats:
+    """Hit/miss/eviction counters shared by every backend."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend,
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+class MemoryCache(_CacheStats):
+    """In-process LRU cache whose entries expire after `ttl` seconds."""
+
+    backend = "memory"
+
+    def __init__(self, name: str, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+                 ttl: float = DEFAULT_CACHE_TTL_SECONDS):
+        super().__init__(name)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SQLiteCache(_CacheStats):
+    """On-disk cache storing JSON-serializable values in a SQLite table.
+
+    Recency is tracked per row so the least recently used entries are evicted
+    once the table grows past `max_entries`.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, name: str, path: str = DEFAULT_CACHE_PATH,
+                 max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+                 ttl: float = DEFAULT_CACHE_TTL_SECONDS):
+        super().__init__(name)
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._table = f"cache_{name}"
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return `(value, expires_at)` for a live entry, or None."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self._table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] < now:
+                if row is not None:
+                    self._conn.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            self._conn.execute(
+                f"UPDATE {self._table} SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        payload = json.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self._table} (key, value, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, expires_at, now),
+            )
+            overflow = self._conn.execute(
+                f"SELECT COUNT(*) FROM {self._table}"
+            ).fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    f"DELETE FROM {self._table} WHERE key IN ("
+                    f"SELECT key FROM {self._table} ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self.evictions += overflow
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+
+
+class TieredCache(_CacheStats):
+    """A small in-memory LRU in front of a persistent cache.
+
+    Reads try memory first and promote persistent hits into it for the
+    rest of their stored lifetime; writes go to both. Entries in memory
+    never outlive the `ttl` they were stored with.
+    """
+
+    backend = "tiered"
+
+    def __init__(self, name: str, front: MemoryCache, back: "SQLiteCache"):
+        super().__init__(name)
+        self.front = front
+        self.back = back
+
+    def __len__(self) -> int:
+        return len(self.back)
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.front.get(key)
+        if value is None:
+            entry = self.back.get_entry(key)
+            if entry is not None:
+                value, expires_at = entry
+                self.front.set(key, value, ttl=expires_at - time.time())
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.back.set(key, value, ttl)
+        self.front.set(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        self.front.delete(key)
+        self.back.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "memory": self.front.stats(), "sqlite": self.back.stats()}
+
+
+def build_cache(name: str, backend: str = DEFAULT_CACHE_BACKEND, **kwargs):
+    """Create a cache for `name` using the configured backend ("memory", "sqlite" or "tiered").
+
+    For "tiered", `memory_entries` sizes the in-memory front; the other
+    arguments configure the SQLite back.
+    """
+    if backend == "tiered":
+        front = MemoryCache(name, max_entries=kwargs.pop("memory_entries", DEFAULT_CACHE_MAX_ENTRIES),
+                            ttl=kwargs.get("ttl", DEFAULT_CACHE_TTL_SECONDS))
+        return TieredCache(name, front, SQLiteCache(name, **kwargs))
+    kwargs.pop("memory_entries", None)
+    if backend == "sqlite":
+        return SQLiteCache(name, **kwargs)
+    if backend == "memory":
+        kwargs.pop("path", None)
+        return MemoryCache(name, **kwargs)
+    raise ValueError(f"Unknown cache backend: {backend}")
+
+
+@lru_cache(maxsize=1)
+def get_analysis_cache():
+    """Cache of generated interview results keyed by repo content."""
+    return build_cache("analysis")
+
+
+@lru_cache(maxsize=1)
+def get_etag_cache():
+    """Cache of GitHub responses and their ETags for conditional requests."""
+    return build_cache("github_etags", max_entries=DEFAULT_CACHE_MAX_ENTRIES * 4)
+
+
+def analysis_cache_key(kind: str, owner: str, repo: str, content_sha: Optional[str]) -> Optional[str]:
+    """Build a content-addressed key, or None when the content SHA is unknown."""
+    if not content_sha:
+        return None
+    return f"{kind}:{owner.lower()}/{repo.lower()}@{content_sha}"
+
+
+
+@lru_cache(maxsize=1)
+def get_resume_store():
+    """Parsed resume fields keyed by a hash of the PDF bytes (see resume_store_key)."""
+    return build_cache(
+        "resumes",
+        backend=RESUME_STORE_BACKEND,
+        path=RESUME_STORE_PATH,
+        max_entries=RESUME_STORE_MAX_ENTRIES,
+        memory_entries=RESUME_STORE_MEMORY_ENTRIES,
+        ttl=RESUME_STORE_TTL_SECONDS,
+    )
+
+
+def resume_store_key(content_sha256: str, extraction_version: int) -> str:
+    """Key a parsed resume by its bytes and the extraction logic that produced it."""
+    return f"resume:v{extraction_version}:{content_sha256}"
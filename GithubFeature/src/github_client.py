@@ -0,0 +1,181 @@
+"""Shared async GitHub API client with connection pooling and bounded fan-out."""
+
+import asyncio
+import base64
+import os
+from functools import lru_cache
+from typing import Dict, Optional
+
+import httpx
+
+from src.cache import get_etag_cache
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx when installed)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+DEFAULT_GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+GITHUB_MAX_CONCURRENCY = int(os.getenv("GITHUB_MAX_CONCURRENCY", "8"))
+GITHUB_TIMEOUT_SECONDS = float(os.getenv("GITHUB_TIMEOUT_SECONDS", "10"))
+
+
+class GitHubClient:
+    """Async GitHub REST client reusing one pooled `httpx.AsyncClient`.
+
+    `base_url` and `transport` can be overridden to point the client at a
+    local stand-in GitHub server (or an `httpx.MockTransport`) in tests.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: str = DEFAULT_GITHUB_API_URL,
+        max_concurrency: int = GITHUB_MAX_CONCURRENCY,
+        timeout: float = GITHUB_TIMEOUT_SECONDS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        etag_cache=None,
+    ):
+        headers = {"Accept": "application/vnd.github+json"}
+        if token and token != "your_github_token_here":
+            headers["Authorization"] = f"token {token}"
+        else:
+            # Without token, we have 60 requests/hour per IP
+            print("⚠️  No GitHub token configured - using unauthenticated requests (60/hour limit)")
+
+        self.authenticated = "Authorization" in headers
+        self.etag_cache = etag_cache
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            http2=HTTP2_AVAILABLE and transport is None,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+                keepalive_expiry=60,
+            ),
+            transport=transport,
+        )
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """Issue a GET through the shared pool, bounded by the concurrency limit."""
+        async with self._semaphore:
+            return await self._client.get(url, **kwargs)
+
+    async def fetch_file(self, owner: str, repo: str, path: str) -> Optional[Dict[str, str]]:
+        """Return `{"content", "sha"}` for `path`, or None on failure.
+
+        When an ETag cache is configured the request is conditional, so an
+        unchanged file costs a 304 that does not count against the rate limit.
+        """
+        api_url = f"/repos/{owner}/{repo}/contents/{path}"
+        cached = self.etag_cache.get(api_url) if self.etag_cache is not None else None
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        try:
+            r = await self.get(api_url, headers=headers)
+
+            if r.status_code == 304 and cached:
+                print(f"✓ {path} unchanged (304), using cached copy")
+                return {"content": cached["content"], "sha": cached["sha"]}
+            elif r.status_code == 200:
+                data = r.json()
+                if "content" in data:
+                    decoded = base64.b64decode(data["content"]).decode("utf-8", errors="ignore")
+                    print(f"✓ Fetched {path}: {len(decoded)} characters")
+                    result = {"content": decoded, "sha": data.get("sha")}
+                    if self.etag_cache is not None and r.headers.get("ETag"):
+                        self.etag_cache.set(api_url, {"etag": r.headers["ETag"], **result})
+                    return result
+            elif r.status_code == 401:
+                print(f"✗ Authentication failed for {path}. Check GITHUB_TOKEN or repo access.")
+            elif r.status_code == 404:
+                print(f"✗ File not found: {path}")
+            elif r.status_code == 403:
+                print(f"✗ Rate limit exceeded for {path}. Add GITHUB_TOKEN to .env")
+            else:
+                print(f"✗ Failed to fetch {path}: Status {r.status_code}")
+        except Exception as e:
+            print(f"✗ Error fetching {path}: {str(e)}")
+
+        return None
+
+    async def fetch_tree(self, owner: str, repo: str, ref: str = "HEAD") -> Optional[Dict]:
+        """Return `{"sha", "tree", "truncated"}` for the whole repo in one request, or None.
+
+        `tree` holds the blob entries (`path`, `sha`, `size`) of the recursive
+        git tree at `ref`. Conditional like `fetch_file`, so an unchanged repo
+        costs a 304.
+        """
+        api_url = f"/repos/{owner}/{repo}/git/trees/{ref}?recursive=1"
+        cached = self.etag_cache.get(api_url) if self.etag_cache is not None else None
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        try:
+            r = await self.get(api_url, headers=headers)
+            if r.status_code == 304 and cached:
+                print(f"✓ Tree of {owner}/{repo} unchanged (304), using cached copy")
+                return {key: cached[key] for key in ("sha", "tree", "truncated")}
+            if r.status_code != 200:
+                print(f"✗ Failed to list tree of {owner}/{repo}: Status {r.status_code}")
+                return None
+
+            data = r.json()
+            result = {
+                "sha": data.get("sha"),
+                "tree": [
+                    {"path": entry["path"], "sha": entry["sha"], "size": entry.get("size", 0)}
+                    for entry in data.get("tree", []) if entry.get("type") == "blob"
+                ],
+                "truncated": bool(data.get("truncated")),
+            }
+            print(f"✓ Listed {owner}/{repo}: {len(result['tree'])} files")
+            if self.etag_cache is not None and r.headers.get("ETag"):
+                self.etag_cache.set(api_url, {"etag": r.headers["ETag"], **result})
+            return result
+        except Exception as e:
+            print(f"✗ Error listing tree of {owner}/{repo}: {str(e)}")
+            return None
+
+    async def fetch_blob(self, owner: str, repo: str, sha: str) -> str:
+        """Return the decoded text of blob `sha`, or an empty string on failure.
+
+        Blobs are content-addressed, so a cached copy never needs revalidating.
+        """
+        api_url = f"/repos/{owner}/{repo}/git/blobs/{sha}"
+        cached = self.etag_cache.get(api_url) if self.etag_cache is not None else None
+        if cached:
+            return cached["content"]
+        try:
+            r = await self.get(api_url)
+            if r.status_code != 200:
+                print(f"✗ Failed to fetch blob {sha[:7]}: Status {r.status_code}")
+                return ""
+            data = r.json()
+            content = data.get("content", "")
+            if data.get("encoding") == "base64":
+                content = base64.b64decode(content).decode("utf-8", errors="ignore")
+            if self.etag_cache is not None:
+                self.etag_cache.set(api_url, {"content": content})
+            return content
+        except Exception as e:
+            print(f"✗ Error fetching blob {sha[:7]}: {str(e)}")
+            return ""
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+@lru_cache(maxsize=1)
+def get_github_client() -> GitHubClient:
+    """Return a cached GitHub client configured from the environment."""
+    return GitHubClient(token=os.getenv("GITHUB_TOKEN"), etag_cache=get_etag_cache())
+
+
+async def close_github_client() -> None:
+    """Close the shared client's connection pool (called on app shutdown)."""
+    if get_github_client.cache_info().currsize:
+        await get_github_client().aclose()
+        get_github_client.cache_clear()
@@ -0,0 +1,91 @@
+"""Incremental JSON parsing: emit each array element as soon as its closing brace arrives."""
+
+import json
+from typing import Any, List, Optional
+
+
+class JsonArrayStreamer:
+    """Pull complete objects out of a JSON document that arrives in chunks.
+
+    Tracks string/escape state and nesting depth character by character,
+    and returns each object of the `key` array (e.g. `{"questions": [...]}`)
+    from `feed` once it is complete. A top-level array works too. Text
+    before the document, such as a ```json fence, is ignored.
+    """
+
+    def __init__(self, key: str = "questions"):
+        self.key = key
+        self._chunks: List[str] = []
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string: List[str] = []
+        self._last_key: Optional[str] = None
+        # Stack depth at which array elements start; -1 once the array has closed
+        self._item_depth: Optional[int] = None
+        self._item: Optional[List[str]] = None
+        self.emitted = 0
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Consume `chunk`; return the array elements it completed, in order."""
+        self._chunks.append(chunk)
+        completed = []
+        stack = self._stack
+
+        for char in chunk:
+            if self._item is not None:
+                self._item.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if len(stack) == 1 and stack[0] == "{":
+                        self._last_key = "".join(self._string)
+                elif len(stack) == 1:
+                    self._string.append(char)
+                continue
+
+            if char == '"':
+                if stack:
+                    self._in_string = True
+                    self._string = []
+            elif char in "{[":
+                if char == "{" and self._item is None and len(stack) == self._item_depth:
+                    self._item = [char]
+                stack.append(char)
+                if char == "[" and self._item_depth is None and self._is_target_array():
+                    self._item_depth = len(stack)
+            elif char in "}]" and stack:
+                stack.pop()
+                if len(stack) == self._item_depth:
+                    if self._item is not None:
+                        item = self._parse_item("".join(self._item))
+                        self._item = None
+                        if item is not None:
+                            completed.append(item)
+                elif self._item_depth is not None and len(stack) < self._item_depth:
+                    self._item_depth = -1
+
+        self.emitted += len(completed)
+        return completed
+
+    def _is_target_array(self) -> bool:
+        if len(self._stack) == 1:
+            return True
+        return len(self._stack) == 2 and self._stack[0] == "{" and self._last_key == self.key
+
+    @staticmethod
+    def _parse_item(raw: str) -> Optional[Any]:
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return None
@@ -0,0 +1,146 @@
+"""Global async concurrency limiter with queue-depth accounting, and a circuit breaker for the LLM."""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Dict
+
+
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "64"))
+# Callers beyond this many queued are sent to the degraded path; 0 = unbounded
+LLM_MAX_QUEUE_DEPTH = int(os.getenv("LLM_MAX_QUEUE_DEPTH", "0"))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "25"))
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "5"))
+LLM_BREAKER_COOLDOWN_SECONDS = float(os.getenv("LLM_BREAKER_COOLDOWN_SECONDS", "30"))
+
+
+class ConcurrencyLimiter:
+    """Caps how many coroutines run a section at once and tracks who is queued.
+
+    Unlike FastAPI's threadpool, waiting here costs a suspended coroutine
+    rather than a thread, so hundreds of requests can queue on one worker.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue_depth: int = 0):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue_depth = max_queue_depth
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.completed = 0
+
+    @asynccontextmanager
+    async def slot(self):
+        """Wait for a free slot, run the body, then release it."""
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self._semaphore.release()
+
+    def saturated(self) -> bool:
+        """True when the queue already holds `max_queue_depth` waiters."""
+        return bool(self.max_queue_depth) and self.waiting >= self.max_queue_depth
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue_depth": self.max_queue_depth,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "peak_queue_depth": self.peak_waiting,
+            "completed": self.completed,
+        }
+
+
+class CircuitBreaker:
+    """Stops calling a failing dependency for a while.
+
+    After `failure_threshold` consecutive failures the breaker opens and
+    `allow()` returns False for `cooldown_seconds`. Then it half-opens and
+    lets a single probe call through while everyone else is still
+    rejected: the probe's success closes the breaker, its failure reopens
+    it. A probe that never reports back is given up on after
+    `cooldown_seconds`, and the next caller probes instead.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, cooldown_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probe_started_at = None
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.cooldown_seconds:
+            return "open"
+        return "half_open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        now = time.monotonic()
+        if state == "half_open" and (
+            self.probe_started_at is None or now - self.probe_started_at >= self.cooldown_seconds
+        ):
+            self.probe_started_at = now
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probe_started_at = None
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self.state == "half_open" or (
+            self.opened_at is None and self.consecutive_failures >= self.failure_threshold
+        ):
+            self.opened_at = time.monotonic()
+            self.probe_started_at = None
+            self.times_opened += 1
+            print(f"⚠️  {self.name} circuit breaker open for {self.cooldown_seconds:g}s "
+                  f"after {self.consecutive_failures} consecutive failures")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "probing": self.probe_started_at is not None,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_llm_limiter() -> ConcurrencyLimiter:
+    """Return the process-wide limiter guarding Gemini calls."""
+    return ConcurrencyLimiter("llm", LLM_MAX_CONCURRENCY, LLM_MAX_QUEUE_DEPTH)
+
+
+@lru_cache(maxsize=1)
+def get_llm_breaker() -> CircuitBreaker:
+    """Return the process-wide circuit breaker for Gemini calls."""
+    return CircuitBreaker("llm", LLM_BREAKER_FAILURES, LLM_BREAKER_COOLDOWN_SECONDS)
@@ -0,0 +1,214 @@
+"""Per-stage latency histograms in Prometheus text format, sampled request traces, slow-request log."""
+
+import contextvars
+import heapq
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+SLOW_REQUEST_SECONDS = float(os.getenv("SLOW_REQUEST_SECONDS", "10"))
+SLOW_REQUEST_LOG_SIZE = int(os.getenv("SLOW_REQUEST_LOG_SIZE", "20"))
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Stages recorded while handling the current request: [(stage, seconds), ...]
+_current_trace: contextvars.ContextVar[Optional[List[Tuple[str, float]]]] = contextvars.ContextVar(
+    "current_trace", default=None
+)
+
+
+def _format_labels(label_names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(label_names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels, rendered in Prometheus text format."""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...],
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        # labels -> (per-bucket counts, sum, count)
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][index] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    le = _format_labels(self.label_names, labels, f'le="{bound:g}"')
+                    lines.append(f"{self.name}_bucket{le} {cumulative}")
+                le = _format_labels(self.label_names, labels, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{le} {count}")
+                lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {total:.6f}")
+                lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {count}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter with labels, rendered in Prometheus text format."""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {value:g}")
+        return lines
+
+
+STAGE_SECONDS = Histogram(
+    "sarthi_stage_duration_seconds", "Time spent in each processing stage.", ("stage",)
+)
+REQUEST_SECONDS = Histogram(
+    "sarthi_request_duration_seconds", "HTTP request duration including streamed bodies.",
+    ("method", "route", "status")
+)
+FALLBACKS = Counter(
+    "sarthi_fallbacks_total", "Requests answered with generic fallback questions.", ("reason",)
+)
+
+
+def observe_stage(name: str, seconds: float) -> None:
+    """Record a stage duration measured elsewhere (e.g. in a worker process)."""
+    STAGE_SECONDS.observe(seconds, name)
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.append((name, seconds))
+
+
+@contextmanager
+def stage(name: str):
+    """Time the enclosed block as stage `name`; works in sync and async code."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(name, time.perf_counter() - started)
+
+
+def render_metrics() -> str:
+    lines = STAGE_SECONDS.render() + REQUEST_SECONDS.render() + FALLBACKS.render()
+    return "\n".join(lines) + "\n"
+
+
+def _format_trace(trace: List[Tuple[str, float]]) -> str:
+    return ", ".join(f"{name}={seconds * 1000:.0f}ms" for name, seconds in trace) or "no stages"
+
+
+class SlowRequestLog:
+    """Keeps the slowest requests seen, with their stage breakdown."""
+
+    def __init__(self, size: int = SLOW_REQUEST_LOG_SIZE):
+        self.size = size
+        self._heap: List[Tuple[float, int, Dict]] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, method: str, path: str, status: int,
+               trace: List[Tuple[str, float]]) -> None:
+        entry = {
+            "duration_ms": round(seconds * 1000, 1),
+            "method": method,
+            "path": path,
+            "status": status,
+            "at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "stages_ms": [[name, round(stage_seconds * 1000, 1)] for name, stage_seconds in trace],
+        }
+        with self._lock:
+            self._seq += 1
+            item = (seconds, self._seq, entry)
+            if len(self._heap) < self.size:
+                heapq.heappush(self._heap, item)
+            elif seconds > self._heap[0][0]:
+                heapq.heapreplace(self._heap, item)
+
+    def entries(self) -> List[Dict]:
+        with self._lock:
+            return [entry for _, _, entry in sorted(self._heap, reverse=True)]
+
+
+slow_requests = SlowRequestLog()
+
+
+class MetricsMiddleware:
+    """Times every HTTP request and collects its stages.
+
+    Requests slower than SLOW_REQUEST_SECONDS are logged with their stage
+    breakdown; a TRACE_SAMPLE_RATE fraction of all requests are logged too.
+    Routes not registered on the app are labelled "other" to bound cardinality.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._routes: Optional[set] = None
+
+    def _route_label(self, scope) -> str:
+        if self._routes is None:
+            app = scope.get("app")
+            self._routes = {getattr(route, "path", None) for route in getattr(app, "routes", [])}
+        return scope["path"] if scope["path"] in self._routes else "other"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace: List[Tuple[str, float]] = []
+        token = _current_trace.set(trace)
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            _current_trace.reset(token)
+            seconds = time.perf_counter() - started
+            method, path = scope["method"], scope["path"]
+            REQUEST_SECONDS.observe(seconds, method, self._route_label(scope), str(status))
+
+            if seconds >= SLOW_REQUEST_SECONDS:
+                slow_requests.record(seconds, method, path, status, trace)
+                print(f"🐢 Slow request {method} {path} {status} took {seconds * 1000:.0f} ms: {_format_trace(trace)}")
+            elif TRACE_SAMPLE_RATE and random.random() < TRACE_SAMPLE_RATE:
+                print(f"[trace] {method} {path} {status} {seconds * 1000:.0f} ms: {_format_trace(trace)}")
@@ -0,0 +1,135 @@
+"""Registry of shared, pre-configured Gemini `GenerativeModel` instances."""
+
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import google.generativeai as genai
+
+
+# Safety settings to reduce blocks on technical content
+# (full enum names; the SDK doesn't accept the short 'DANGEROUS_CONTENT' alias)
+DEFAULT_SAFETY_SETTINGS = {
+    'HARM_CATEGORY_HARASSMENT': 'BLOCK_NONE',
+    'HARM_CATEGORY_HATE_SPEECH': 'BLOCK_NONE',
+    'HARM_CATEGORY_SEXUALLY_EXPLICIT': 'BLOCK_NONE',
+    'HARM_CATEGORY_DANGEROUS_CONTENT': 'BLOCK_NONE'
+}
+
+# Profiles used by the endpoints. Each one can be overridden per environment:
+#   GEMINI_<PROFILE>_MODEL   e.g. GEMINI_PROJECT_INTERVIEW_MODEL=gemini-2.5-flash
+#   GEMINI_<PROFILE>_CONFIG  JSON merged into the generation config
+MODEL_PROFILES: Dict[str, Dict[str, Any]] = {
+    "questions": {
+        "model_name": "gemini-2.5-flash",
+        "generation_config": None,
+        "safety_settings": None,
+    },
+    "project_interview": {
+        "model_name": "gemini-1.5-flash",  # Use stable model instead of experimental
+        "generation_config": {
+            'temperature': 0.7,
+            'response_mime_type': 'application/json'
+        },
+        "safety_settings": DEFAULT_SAFETY_SETTINGS,
+    },
+}
+
+
+
+def _load_config_overrides() -> Dict[str, Dict[str, Any]]:
+    """Parse every GEMINI_<PROFILE>_CONFIG once; invalid ones are reported and ignored."""
+    overrides = {}
+    for profile in MODEL_PROFILES:
+        env_name = f"GEMINI_{profile.upper()}_CONFIG"
+        raw = os.getenv(env_name)
+        if not raw:
+            continue
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError as e:
+            print(f"[models] ⚠️  Ignoring {env_name}: not valid JSON ({str(e)})")
+            continue
+        if not isinstance(value, dict):
+            print(f"[models] ⚠️  Ignoring {env_name}: expected a JSON object")
+            continue
+        overrides[profile] = value
+    return overrides
+
+
+CONFIG_OVERRIDES = _load_config_overrides()
+
+_models: Dict[str, genai.GenerativeModel] = {}
+_lock = threading.Lock()
+
+
+def resolve_profile(profile: str) -> Dict[str, Any]:
+    """Return the profile's model name and configs with env overrides applied."""
+    if profile not in MODEL_PROFILES:
+        raise KeyError(f"Unknown Gemini model profile: {profile}")
+
+    base = MODEL_PROFILES[profile]
+    generation_config = dict(base["generation_config"] or {})
+    generation_config.update(CONFIG_OVERRIDES.get(profile, {}))
+
+    return {
+        "model_name": os.getenv(f"GEMINI_{profile.upper()}_MODEL", base["model_name"]),
+        "generation_config": generation_config or None,
+        "safety_settings": base["safety_settings"],
+    }
+
+
+def _registry_key(settings: Dict[str, Any]) -> str:
+    return json.dumps(settings, sort_keys=True)
+
+
+def get_model(profile: str) -> genai.GenerativeModel:
+    """Return the shared model for `profile`, building it on first use."""
+    settings = resolve_profile(profile)
+    key = _registry_key(settings)
+    model = _models.get(key)
+    if model is None:
+        with _lock:
+            model = _models.get(key)
+            if model is None:
+                print(f"[models] Building {settings['model_name']} for profile '{profile}'")
+                model = genai.GenerativeModel(
+                    settings["model_name"],
+                    generation_config=settings["generation_config"],
+                    safety_settings=settings["safety_settings"],
+                )
+                _models[key] = model
+    return model
+
+
+def model_name(profile: str) -> str:
+    return resolve_profile(profile)["model_name"]
+
+
+async def warm_up_models(ping: Optional[bool] = None) -> None:
+    """Build every profile's model at startup.
+
+    With `GEMINI_WARMUP_PING=true` each model also makes a tiny generation
+    call so the first real request doesn't pay connection setup.
+    """
+    if ping is None:
+        ping = os.getenv("GEMINI_WARMUP_PING", "false").lower() == "true"
+
+    for profile in MODEL_PROFILES:
+        name = resolve_profile(profile)["model_name"]
+        try:
+            model = get_model(profile)
+        except Exception as e:
+            # Don't block startup; requests for this profile fall back until it's fixed
+            print(f"[models] ⚠️  Could not build {name}: {str(e)}")
+            continue
+        if not ping:
+            continue
+        try:
+            await model.generate_content_async(
+                "Reply with OK.", generation_config={"max_output_tokens": 1}
+            )
+            print(f"[models] ✓ Warmed up {name}")
+        except Exception as e:
+            print(f"[models] ⚠️  Warm-up call failed for {name}: {str(e)}")
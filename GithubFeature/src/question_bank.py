@@ -0,0 +1,164 @@
+"""Offline question bank: detects the stack from repo context and ranks templated questions by TF-IDF."""
+
+import json
+import math
+import os
+import posixpath
+import re
+import threading
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+
+QUESTION_BANK_FILE = os.getenv(
+    "QUESTION_BANK_FILE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "question_bank.json")
+)
+QUESTION_BANK_COUNT = int(os.getenv("QUESTION_BANK_COUNT", "5"))
+
+# File names in the analyzed set are strong signals even when the README is silent
+EXTENSION_SIGNALS = {
+    ".py": "python", ".js": "javascript", ".jsx": "react", ".ts": "typescript", ".tsx": "typescript",
+    ".java": "java", ".go": "go", ".rs": "rust", ".cpp": "cpp", ".vue": "vue",
+}
+FILE_SIGNALS = {
+    "package.json": "node", "requirements.txt": "python", "pyproject.toml": "python",
+    "manage.py": "django", "dockerfile": "docker", "docker-compose.yml": "docker",
+    "docker-compose.yaml": "docker", "go.mod": "go", "cargo.toml": "rust", "pom.xml": "java",
+}
+# Once a category or technology has been picked, similar questions rank lower
+REPEAT_CATEGORY_PENALTY = 0.6
+REPEAT_TECH_PENALTY = 0.5
+
+
+class QuestionBank:
+    """Templated questions indexed by technology tag.
+
+    Detection is one regex pass over the lowercased context. Ranking uses
+    an inverted index from tag to questions, with TF-IDF weights (tag
+    frequency in the context × rarity across the bank). Untagged, generic
+    questions fill any remaining slots.
+    """
+
+    def __init__(self, data: Dict):
+        self.signals: Dict[str, Dict] = data["signals"]
+        self.questions: List[Dict] = data["questions"]
+        self.served = 0
+        self._lock = threading.Lock()
+
+        alias_to_signal = {}
+        for signal, spec in self.signals.items():
+            for alias in spec["aliases"]:
+                alias_to_signal[alias.lower()] = signal
+        self._alias_to_signal = alias_to_signal
+        # Longest first so "spring boot" wins over "spring"
+        aliases = sorted(alias_to_signal, key=len, reverse=True)
+        self._alias_re = re.compile(
+            r"(?<![a-z0-9_])(" + "|".join(re.escape(alias) for alias in aliases) + r")(?![a-z0-9_])"
+        )
+
+        document_frequency = Counter(tag for question in self.questions for tag in set(question["tags"]))
+        total = len(self.questions)
+        self.idf = {tag: math.log((1 + total) / (1 + df)) + 1 for tag, df in document_frequency.items()}
+        self.index: Dict[str, List[int]] = {}
+        self._norms = []
+        for position, question in enumerate(self.questions):
+            for tag in question["tags"]:
+                self.index.setdefault(tag, []).append(position)
+            self._norms.append(math.sqrt(sum(self.idf[tag] ** 2 for tag in question["tags"])) or 1.0)
+
+    def detect(self, text: str, files: Optional[List[str]] = None) -> Dict[str, int]:
+        """Count mentions of each known technology in `text` and `files`."""
+        counts = Counter(self._alias_to_signal[match] for match in self._alias_re.findall(text.lower()))
+        for path in files or []:
+            name = posixpath.basename(path).lower()
+            signal = FILE_SIGNALS.get(name) or EXTENSION_SIGNALS.get(posixpath.splitext(name)[1])
+            if signal:
+                counts[signal] += 1
+        return dict(counts)
+
+    def rank(self, detected: Dict[str, int]) -> List[tuple]:
+        """Return (score, position, best tag) for every question matching a detected tag, best first."""
+        weights = {
+            tag: (1 + math.log(count)) * self.idf[tag]
+            for tag, count in detected.items() if tag in self.idf
+        }
+        scores: Dict[int, float] = {}
+        best_tag: Dict[int, str] = {}
+        for tag, weight in weights.items():
+            for position in self.index[tag]:
+                scores[position] = scores.get(position, 0.0) + weight * self.idf[tag]
+                if position not in best_tag or weight > weights[best_tag[position]]:
+                    best_tag[position] = tag
+        ranked = [(score / self._norms[position], position, best_tag[position]) for position, score in scores.items()]
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        return ranked
+
+    def select(self, detected: Dict[str, int], count: int = QUESTION_BANK_COUNT) -> List[tuple]:
+        """Pick `count` (position, tag) pairs, spreading them over categories and technologies."""
+        candidates = self.rank(detected)
+        chosen, categories, techs = [], Counter(), Counter()
+        while candidates and len(chosen) < count:
+            best = max(
+                candidates,
+                key=lambda item: (
+                    item[0]
+                    * REPEAT_CATEGORY_PENALTY ** categories[self.questions[item[1]]["category"]]
+                    * REPEAT_TECH_PENALTY ** techs[item[2]],
+                    -item[1],
+                ),
+            )
+            candidates.remove(best)
+            chosen.append((best[1], best[2]))
+            categories[self.questions[best[1]]["category"]] += 1
+            techs[best[2]] += 1
+
+        # Generic questions keep their file order, which puts the broadest first
+        for position, question in enumerate(self.questions):
+            if len(chosen) >= count:
+                break
+            if not question["tags"]:
+                chosen.append((position, None))
+        return chosen
+
+    def generate(self, owner: str, repo: str, context: str = "", files: Optional[List[str]] = None,
+                 count: int = QUESTION_BANK_COUNT) -> Dict:
+        """Project-specific questions for `owner/repo` in the /generate-project-interview shape."""
+        started = time.perf_counter()
+        detected = self.detect(context, files)
+        questions = []
+        for position, tag in self.select(detected, count):
+            entry = self.questions[position]
+            tech = self.signals[tag]["name"] if tag else "the project"
+            questions.append({
+                "question": entry["question"].format(repo=repo, tech=tech),
+                "category": entry["category"],
+                "difficulty": entry["difficulty"],
+                "expectedKeyPoints": list(entry["expectedKeyPoints"]),
+                "context": f"Detected {tech} in the repository" if tag else "General project understanding",
+            })
+        with self._lock:
+            self.served += 1
+        return {
+            "questions": questions,
+            "repo_url": f"https://github.com/{owner}/{repo}",
+            "repo_name": f"{owner}/{repo}",
+            "analyzed_files": list(files or []),
+            "detected_stack": [
+                self.signals[tag]["name"] for tag, _ in sorted(detected.items(), key=lambda item: (-item[1], item[0]))
+            ],
+            "source": "question_bank",
+            "generation_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def stats(self) -> Dict:
+        return {"questions": len(self.questions), "signals": len(self.signals), "served": self.served}
+
+
+@lru_cache(maxsize=1)
+def get_question_bank() -> QuestionBank:
+    """Load QUESTION_BANK_FILE once per process."""
+    with open(QUESTION_BANK_FILE, encoding="utf-8") as f:
+        return QuestionBank(json.load(f))
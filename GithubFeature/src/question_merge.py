@@ -0,0 +1,62 @@
+"""Merge interview questions from several repos: drop near-duplicates, interleave by repo."""
+
+import re
+from typing import Dict, List, Optional
+
+
+# Questions whose word sets overlap at least this much count as the same question
+DUPLICATE_JACCARD = 0.8
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _question_words(text: str, repo: str) -> frozenset:
+    # The repo name is dropped so templated questions about two repos compare equal
+    repo_words = set(WORD_RE.findall(repo.lower()))
+    return frozenset(word for word in WORD_RE.findall(text.lower()) if word not in repo_words)
+
+
+class QuestionMerger:
+    """Collects per-repo question lists as they finish and keeps only new questions.
+
+    `add` returns the questions it kept, each tagged with its repo;
+    `merged` interleaves the repos round-robin in `repo_order`, so a capped
+    interview still covers every project early.
+    """
+
+    def __init__(self, repo_order: List[str]):
+        self.repo_order = list(repo_order)
+        self._by_repo: Dict[str, List[Dict]] = {}
+        self._seen: List[frozenset] = []
+        self.duplicates = 0
+
+    def _is_duplicate(self, words: frozenset) -> bool:
+        for seen in self._seen:
+            union = len(words | seen)
+            if union and len(words & seen) / union >= DUPLICATE_JACCARD:
+                return True
+        return False
+
+    def add(self, repo: str, questions: List[Dict]) -> List[Dict]:
+        repo_name = repo.split("/")[-1]
+        kept = []
+        for question in questions:
+            text = question.get("question") if isinstance(question, dict) else None
+            if not text:
+                continue
+            words = _question_words(text, repo_name)
+            if self._is_duplicate(words):
+                self.duplicates += 1
+                continue
+            self._seen.append(words)
+            kept.append({**question, "repo": repo})
+        self._by_repo.setdefault(repo, []).extend(kept)
+        return kept
+
+    def merged(self, limit: Optional[int] = None) -> List[Dict]:
+        queues = [list(self._by_repo.get(repo, [])) for repo in self.repo_order]
+        merged = []
+        while any(queues) and (limit is None or len(merged) < limit):
+            for queue in queues:
+                if queue and (limit is None or len(merged) < limit):
+                    merged.append(queue.pop(0))
+        return merged
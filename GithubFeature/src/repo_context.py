@@ -0,0 +1,171 @@
+"""Bounded repository context for the LLM: one tree listing, ranked key files, token budget."""
+
+import asyncio
+import os
+import posixpath
+from typing import Dict, List, Optional
+
+from src.github_client import GitHubClient
+from src.metrics import stage
+from src.text_cleaner import clean_markdown
+
+
+REPO_CONTEXT_TOKEN_BUDGET = int(os.getenv("REPO_CONTEXT_TOKEN_BUDGET", "12000"))
+REPO_CONTEXT_MAX_FILES = int(os.getenv("REPO_CONTEXT_MAX_FILES", "12"))
+REPO_CONTEXT_MAX_FILE_TOKENS = int(os.getenv("REPO_CONTEXT_MAX_FILE_TOKENS", "2000"))
+# Share of the budget the README may take when source files are available
+REPO_CONTEXT_README_SHARE = float(os.getenv("REPO_CONTEXT_README_SHARE", "0.4"))
+MAX_CANDIDATE_FILE_BYTES = 100 * 1024
+# Rough but stable: ~4 characters per token for English and code
+CHARS_PER_TOKEN = 4
+
+README_NAMES = ("readme.md", "readme.rst", "readme.txt", "readme")
+MANIFEST_FILES = {
+    "package.json", "requirements.txt", "pyproject.toml", "setup.py", "pipfile",
+    "cargo.toml", "go.mod", "pom.xml", "build.gradle", "gemfile", "composer.json",
+    "dockerfile", "docker-compose.yml", "docker-compose.yaml",
+}
+ENTRY_POINT_FILES = {
+    "main.py", "app.py", "server.js", "index.js", "index.ts", "main.js", "app.js",
+    "main.cpp", "main.java", "main.go", "manage.py", "wsgi.py", "asgi.py", "__main__.py",
+    "server.py", "server.ts", "main.ts", "main.rs", "lib.rs", "app.tsx", "index.tsx", "main.tsx",
+}
+SOURCE_EXTENSIONS = (".py", ".js", ".ts", ".jsx", ".tsx", ".cpp", ".java", ".go", ".rs")
+KEY_NAME_HINTS = ("app", "server", "route", "api", "model", "service", "controller", "handler", "schema", "config")
+SKIPPED_DIRS = {
+    "node_modules", "vendor", "dist", "build", "out", "target", ".git", ".github",
+    "__pycache__", "venv", ".venv", "env", "site-packages", "coverage", ".next", "migrations",
+}
+SKIPPED_FILES = {"package-lock.json", "yarn.lock", "pnpm-lock.yaml", "poetry.lock", "pipfile.lock", "cargo.lock"}
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def score_file(path: str, size: int) -> Optional[float]:
+    """Heuristic usefulness of a file to the interviewer, or None to skip it."""
+    parts = path.lower().split("/")
+    name = parts[-1]
+    if any(part in SKIPPED_DIRS for part in parts[:-1]) or name in SKIPPED_FILES:
+        return None
+    if size > MAX_CANDIDATE_FILE_BYTES or name.endswith((".min.js", ".map")):
+        return None
+
+    if name in ENTRY_POINT_FILES:
+        score = 100.0
+    elif name in MANIFEST_FILES:
+        score = 80.0
+    elif name.endswith(SOURCE_EXTENSIONS):
+        score = 40.0
+        stem = posixpath.splitext(name)[0]
+        if any(hint in stem for hint in KEY_NAME_HINTS):
+            score += 15
+    else:
+        return None
+
+    # Prefer top-level code over deeply nested helpers, and code over tests
+    score -= 5 * (len(parts) - 1)
+    if "test" in name or any(part in ("test", "tests", "__tests__", "spec") for part in parts[:-1]):
+        score -= 30
+    if size < 200:
+        score -= 10
+    return score
+
+
+def rank_files(tree: List[Dict]) -> List[Dict]:
+    """Tree blob entries worth showing the model, best first."""
+    scored = []
+    for entry in tree:
+        score = score_file(entry["path"], entry.get("size", 0))
+        if score is not None:
+            scored.append((score, entry["path"], entry))
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return [entry for _, _, entry in scored]
+
+
+def find_readme(tree: List[Dict]) -> Optional[Dict]:
+    for entry in tree:
+        if "/" not in entry["path"] and entry["path"].lower() in README_NAMES:
+            return entry
+    return None
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    marker = "\n... [truncated]"
+    return text[:max(0, max_chars - len(marker))] + marker
+
+
+async def build_repo_context(
+    client: GitHubClient,
+    owner: str,
+    repo: str,
+    tree: Optional[Dict] = None,
+    token_budget: int = REPO_CONTEXT_TOKEN_BUDGET,
+) -> Dict:
+    """Assemble README + key source files into at most `token_budget` tokens.
+
+    `tree` is the result of `client.fetch_tree` (fetched here if omitted).
+    Without a tree (private repo, rate limit) only the README is used, via
+    the contents API. Returns `{"text", "files", "tokens", "readme_sha"}`.
+    """
+    if tree is None:
+        tree = await client.fetch_tree(owner, repo)
+
+    if tree is None:
+        readme = await client.fetch_file(owner, repo, "README.md")
+        readme_entry, ranked, readme_text = None, [], readme["content"] if readme else ""
+        readme_sha = readme and readme["sha"]
+    else:
+        readme_entry = find_readme(tree["tree"])
+        ranked = rank_files(tree["tree"])[:REPO_CONTEXT_MAX_FILES]
+        readme_sha = readme_entry and readme_entry["sha"]
+        readme_text = ""
+
+    # Only fetch what can plausibly fit: sizes from the tree are bytes ~ chars
+    candidates, estimated = [], 0
+    for entry in ranked:
+        if estimated >= token_budget:
+            break
+        candidates.append(entry)
+        estimated += min(entry.get("size", 0) // CHARS_PER_TOKEN, REPO_CONTEXT_MAX_FILE_TOKENS)
+
+    fetches = [client.fetch_blob(owner, repo, entry["sha"]) for entry in candidates]
+    if readme_entry is not None:
+        fetches.append(client.fetch_blob(owner, repo, readme_entry["sha"]))
+    with stage("github_blobs"):
+        contents = await asyncio.gather(*fetches)
+    if readme_entry is not None:
+        readme_text = contents.pop()
+
+    sections, files = [], []
+    remaining = token_budget
+    readme_budget = int(token_budget * REPO_CONTEXT_README_SHARE) if candidates else token_budget
+    # Cleaning stops at the cap, so a huge README costs no more than the part kept
+    with stage("readme_clean"):
+        readme_text = clean_markdown(readme_text, max_chars=readme_budget * CHARS_PER_TOKEN)
+    if readme_text:
+        section = "README:\n" + readme_text
+        sections.append(section)
+        files.append(readme_entry["path"] if readme_entry else "README.md")
+        remaining -= estimate_tokens(section)
+
+    for entry, content in zip(candidates, contents):
+        if remaining <= 0:
+            break
+        if not content.strip():
+            continue
+        header = f"--- {entry['path']} ---\n"
+        allowed = min(REPO_CONTEXT_MAX_FILE_TOKENS, remaining - estimate_tokens(header))
+        if allowed <= 0:
+            break
+        section = header + _truncate(content.strip(), allowed)
+        sections.append(section)
+        files.append(entry["path"])
+        remaining -= estimate_tokens(section)
+
+    text = "\n\n".join(sections)
+    return {"text": text, "files": files, "tokens": estimate_tokens(text), "readme_sha": readme_sha}
@@ -0,0 +1,270 @@
+"""Process-pool execution of resume parsing for batch uploads."""
+
+import asyncio
+import hashlib
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from io import BytesIO
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from src.cache import get_resume_store, resume_store_key
+from src.metrics import observe_stage
+from src.services import EXTRACTION_VERSION, extract_resume_info
+from src.uploads import MAX_BATCH_UPLOAD_BYTES, MAX_RESUME_UPLOAD_BYTES
+
+
+RESUME_PARSE_WORKERS = int(os.getenv("RESUME_PARSE_WORKERS", str(os.cpu_count() or 1)))
+RESUME_PARSE_TIMEOUT_SECONDS = float(os.getenv("RESUME_PARSE_TIMEOUT_SECONDS", "20"))
+MAX_BATCH_FILES = int(os.getenv("MAX_BATCH_FILES", "1000"))
+# Hash bigger uploads off the event loop (hashlib releases the GIL)
+INLINE_HASH_MAX_BYTES = 1024 * 1024
+
+# (filename, pdf bytes) or (filename, None) when the entry was rejected up front
+BatchDocument = Tuple[str, Optional[bytes]]
+
+
+@lru_cache(maxsize=1)
+def get_parse_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool sized to RESUME_PARSE_WORKERS."""
+    return ProcessPoolExecutor(max_workers=RESUME_PARSE_WORKERS)
+
+
+def shutdown_parse_pool() -> None:
+    if get_parse_pool.cache_info().currsize:
+        get_parse_pool().shutdown(wait=False, cancel_futures=True)
+        get_parse_pool.cache_clear()
+
+
+class ParseStats:
+    """Running totals of time spent queued for a worker vs. parsing."""
+
+    def __init__(self):
+        self.documents = 0
+        self.timeouts = 0
+        self.queue_wait_ms_total = 0.0
+        self.parse_ms_total = 0.0
+        self.queue_wait_ms_max = 0.0
+        self.parse_ms_max = 0.0
+
+    def record(self, queue_wait_ms: float, parse_ms: float) -> None:
+        self.documents += 1
+        self.queue_wait_ms_total += queue_wait_ms
+        self.parse_ms_total += parse_ms
+        self.queue_wait_ms_max = max(self.queue_wait_ms_max, queue_wait_ms)
+        self.parse_ms_max = max(self.parse_ms_max, parse_ms)
+
+    def stats(self) -> Dict[str, float]:
+        n = self.documents or 1
+        return {
+            "workers": RESUME_PARSE_WORKERS,
+            "timeout_seconds": RESUME_PARSE_TIMEOUT_SECONDS,
+            "documents": self.documents,
+            "timeouts": self.timeouts,
+            "queue_wait_ms_avg": round(self.queue_wait_ms_total / n, 2),
+            "queue_wait_ms_max": round(self.queue_wait_ms_max, 2),
+            "parse_ms_avg": round(self.parse_ms_total / n, 2),
+            "parse_ms_max": round(self.parse_ms_max, 2),
+        }
+
+
+parse_stats = ParseStats()
+
+
+def parse_resume_document(data: bytes, raise_errors: bool = True) -> Dict[str, Optional[str | List[str]]]:
+    """Worker entry point: parse one PDF, raising instead of returning empty fields."""
+    parsed = extract_resume_info(data, raise_errors=raise_errors)
+    return {
+        "name": parsed.get("name"),
+        "email": parsed.get("email"),
+        "github_links": parsed.get("github_links", []),
+        "linkedin": parsed.get("linkedin"),
+        "phone": parsed.get("phone")
+    }
+
+
+@lru_cache(maxsize=1)
+def get_parse_slots() -> asyncio.Semaphore:
+    """One slot per pool worker; a document only reaches the pool once it holds one."""
+    return asyncio.Semaphore(RESUME_PARSE_WORKERS)
+
+
+def _reset_broken_pool(pool: ProcessPoolExecutor) -> None:
+    # Every in-flight document sees the same broken pool; only the first resets it
+    if get_parse_pool.cache_info().currsize and get_parse_pool() is pool:
+        pool.shutdown(wait=False, cancel_futures=True)
+        get_parse_pool.cache_clear()
+
+
+def _terminate_workers(pool: ProcessPoolExecutor) -> None:
+    # ProcessPoolExecutor has no public way to stop a running task (before 3.14)
+    for process in list((pool._processes or {}).values()):
+        if process.is_alive():
+            process.terminate()
+
+
+def _recycle_pool(pool: ProcessPoolExecutor) -> None:
+    """Swap in a fresh pool after a timeout, so a stuck worker can't hold a slot forever.
+
+    Other documents already running on the old pool get until their own
+    deadline to finish; then its remaining workers, including the stuck
+    one, are terminated.
+    """
+    if get_parse_pool.cache_info().currsize and get_parse_pool() is pool:
+        get_parse_pool.cache_clear()
+        pool.shutdown(wait=False, cancel_futures=True)
+        asyncio.get_running_loop().call_later(RESUME_PARSE_TIMEOUT_SECONDS, _terminate_workers, pool)
+
+
+def _retrieve_outcome(done: asyncio.Future) -> None:
+    # Retrieve the outcome of parses nobody awaits any more (timed out or cancelled)
+    if not done.cancelled():
+        done.exception()
+
+
+def _timed_parse(data: bytes, raise_errors: bool) -> Tuple[Dict, float]:
+    started = time.perf_counter()
+    parsed = parse_resume_document(data, raise_errors)
+    return parsed, time.perf_counter() - started
+
+
+async def parse_resume_offloaded(data: bytes, raise_errors: bool = True) -> Tuple[Dict, Dict[str, float]]:
+    """Parse one PDF on the process pool with a per-document timeout.
+
+    Waiting for a free worker is reported as queue wait; the
+    RESUME_PARSE_TIMEOUT_SECONDS timer starts only once a worker is free, so
+    a long queue never times documents out. Returns the parsed fields and
+    `{"queue_wait_ms", "parse_ms"}`. Raises `asyncio.TimeoutError` on expiry,
+    after moving to a fresh pool (see `_recycle_pool`), and RuntimeError if a
+    worker crashed; the broken pool is replaced.
+    """
+    loop = asyncio.get_running_loop()
+    slots = get_parse_slots()
+    queued_at = time.perf_counter()
+    await slots.acquire()
+    queue_wait_ms = (time.perf_counter() - queued_at) * 1000
+
+    released = False
+
+    def release_slot(_=None) -> None:
+        nonlocal released
+        if not released:
+            released = True
+            slots.release()
+
+    pool = get_parse_pool()
+    try:
+        try:
+            future = loop.run_in_executor(pool, _timed_parse, data, raise_errors)
+        except BaseException:
+            release_slot()
+            raise
+        future.add_done_callback(_retrieve_outcome)
+        # A parse abandoned by a cancelled caller keeps its slot until the worker is done
+        future.add_done_callback(release_slot)
+        parsed, parse_seconds = await asyncio.wait_for(
+            asyncio.shield(future), timeout=RESUME_PARSE_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        parse_stats.timeouts += 1
+        _recycle_pool(pool)
+        release_slot()
+        raise
+    except BrokenProcessPool:
+        # A worker died (e.g. crashed on a malformed PDF); start a fresh pool
+        _reset_broken_pool(pool)
+        raise RuntimeError("Resume parser worker crashed")
+
+    timings = {"queue_wait_ms": queue_wait_ms, "parse_ms": parse_seconds * 1000}
+    parse_stats.record(**timings)
+    observe_stage("pdf_queue_wait", timings["queue_wait_ms"] / 1000)
+    observe_stage("pdf_parse", timings["parse_ms"] / 1000)
+    return parsed, timings
+
+
+async def parse_resume_cached(data: bytes, raise_errors: bool = True) -> Tuple[Dict, Dict[str, float]]:
+    """`parse_resume_offloaded` behind the resume store, keyed by SHA-256 of the bytes.
+
+    A repeat upload of the same PDF returns the stored fields without parsing;
+    timings then report `"cached": True`. Results where nothing was found are
+    not stored, so a transient failure isn't remembered.
+    """
+    if len(data) > INLINE_HASH_MAX_BYTES:
+        digest = await asyncio.to_thread(lambda: hashlib.sha256(data).hexdigest())
+    else:
+        digest = hashlib.sha256(data).hexdigest()
+    key = resume_store_key(digest, EXTRACTION_VERSION)
+
+    store = get_resume_store()
+    stored = store.get(key)
+    if stored is not None:
+        return stored, {"queue_wait_ms": 0.0, "parse_ms": 0.0, "cached": True}
+
+    parsed, timings = await parse_resume_offloaded(data, raise_errors)
+    if parsed.get("name") or parsed.get("email") or parsed.get("github_links"):
+        store.set(key, parsed)
+    return parsed, {**timings, "cached": False}
+
+
+def expand_zip(filename: str, data: bytes, max_files: int = MAX_BATCH_FILES,
+               max_bytes: int = MAX_BATCH_UPLOAD_BYTES) -> List[BatchDocument]:
+    """Return the PDFs inside a zip upload, rejecting oversized entries.
+
+    Raises 413 before decompressing past `max_files` PDFs or `max_bytes` of
+    declared uncompressed size, so a small archive can't expand without bound.
+    """
+    documents, expanded = [], 0
+    try:
+        with zipfile.ZipFile(BytesIO(data)) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or not info.filename.lower().endswith('.pdf'):
+                    continue
+                if len(documents) >= max_files:
+                    raise HTTPException(status_code=413, detail=f"Batch exceeds {MAX_BATCH_FILES} documents")
+                entry_name = f"{filename}/{info.filename}"
+                if info.file_size > MAX_RESUME_UPLOAD_BYTES:
+                    documents.append((entry_name, None))
+                    continue
+                expanded += info.file_size
+                if expanded > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Batch expands to more than {MAX_BATCH_UPLOAD_BYTES // (1024 * 1024)} MB"
+                    )
+                documents.append((entry_name, archive.read(info)))
+    except zipfile.BadZipFile:
+        documents.append((filename, None))
+    return documents
+
+
+async def _parse_one(index: int, filename: str, data: Optional[bytes]) -> Dict:
+    result = {"index": index, "filename": filename}
+    if data is None:
+        return {**result, "status": "error", "error": "Not a readable PDF (or exceeds the size limit)"}
+
+    try:
+        parsed, timings = await parse_resume_cached(data)
+        return {**result, "status": "ok", **parsed}
+    except asyncio.TimeoutError:
+        return {**result, "status": "error", "error": f"Parsing timed out after {RESUME_PARSE_TIMEOUT_SECONDS:g}s"}
+    except Exception as exc:
+        return {**result, "status": "error", "error": str(exc)}
+
+
+async def parse_batch(documents: List[BatchDocument]) -> AsyncIterator[Dict]:
+    """Parse documents across the process pool, yielding results as each finishes."""
+    tasks = [
+        asyncio.ensure_future(_parse_one(index, filename, data))
+        for index, (filename, data) in enumerate(documents)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
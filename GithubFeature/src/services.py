@@ -1,100 +1,189 @@
 import re
 import PyPDF2
-from typing import Dict, List, Optional
+from io import BytesIO
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 
+# A file path, raw PDF bytes, or an open binary stream (e.g. BytesIO)
+PdfSource = Union[str, bytes, bytearray, BinaryIO]
 
-def extract_resume_info(pdf_path: str) -> Dict[str, Optional[str | List[str]]]:
+# Bump whenever extraction output changes so stored parse results are ignored
+EXTRACTION_VERSION = 3
+
+
+def extract_resume_info(source: PdfSource, raise_errors: bool = False) -> Dict[str, Optional[str | List[str]]]:
     result = {
         'name': None,
         'email': None,
-        'github_links': []
+        'github_links': [],
+        'linkedin': None,
+        'phone': None
     }
     
     try:
-        text = extract_text_from_pdf(pdf_path)
+        text, annotation_links = read_pdf(source)
+        contacts = extract_contacts(text)
         result['name'] = extract_name(text)
-        result['email'] = extract_email(text)
-        result['github_links'] = extract_github_links_from_annotations(pdf_path)
-        
-        if not result['github_links']:
-            result['github_links'] = extract_github_links(text)
+        result['email'] = contacts['emails'][0] if contacts['emails'] else None
+        result['linkedin'] = contacts['linkedin_links'][0] if contacts['linkedin_links'] else None
+        result['phone'] = contacts['phones'][0] if contacts['phones'] else None
+        result['github_links'] = annotation_links or contacts['github_links']
     except Exception as e:
+        if raise_errors:
+            raise
         print(f"Error processing PDF: {e}")
     
     return result
 
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    text = ""
+def read_pdf(source: PdfSource) -> Tuple[str, List[str]]:
+    """Open the PDF once and collect page text and GitHub link annotations in one pass."""
+    if isinstance(source, (bytes, bytearray)):
+        source = BytesIO(source)
+
     try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
+        pdf_reader = PyPDF2.PdfReader(source)
     except Exception as e:
         raise Exception(f"Failed to read PDF: {e}")
-    
-    return text
-
 
-def extract_github_links_from_annotations(pdf_path: str) -> List[str]:
+    page_texts = []
     github_links = []
-    
+    seen = set()
+
+    for page in pdf_reader.pages:
+        try:
+            page_texts.append(page.extract_text())
+        except Exception as e:
+            raise Exception(f"Failed to read PDF: {e}")
+
+        try:
+            for uri in _page_link_uris(page):
+                if 'github.com' in uri.lower() and '/' in uri.split('github.com/')[-1]:
+                    if uri not in seen:
+                        seen.add(uri)
+                        github_links.append(uri)
+        except Exception as e:
+            print(f"Error extracting annotations: {e}")
+
+    text = "".join(page_text + "\n" for page_text in page_texts)
+    return text, github_links
+
+
+def _page_link_uris(page) -> List[str]:
+    uris = []
+    if '/Annots' in page:
+        for annotation in page['/Annots']:
+            obj = annotation.get_object()
+            if '/A' in obj:
+                action = obj['/A']
+                if '/URI' in action:
+                    uris.append(action['/URI'])
+    return uris
+
+
+def extract_text_from_pdf(pdf_path: PdfSource) -> str:
+    return read_pdf(pdf_path)[0]
+
+
+def extract_github_links_from_annotations(pdf_path: PdfSource) -> List[str]:
     try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            
-            for page in pdf_reader.pages:
-                if '/Annots' in page:
-                    annotations = page['/Annots']
-                    
-                    for annotation in annotations:
-                        obj = annotation.get_object()
-                        
-                        if '/A' in obj:
-                            action = obj['/A']
-                            if '/URI' in action:
-                                uri = action['/URI']
-                                if 'github.com' in uri.lower():
-                                    if '/' in uri.split('github.com/')[-1]:
-                                        if uri not in github_links:
-                                            github_links.append(uri)
+        return read_pdf(pdf_path)[1]
     except Exception as e:
         print(f"Error extracting annotations: {e}")
-    
-    return github_links
+        return []
+
+
+# Contact patterns, compiled once. Each starts at the field's most distinctive
+# literal ("@", "github.com/", ...) so the regex engine can skip ahead fast;
+# the email local part and any URL scheme are read back from the match.
+EMAIL_DOMAIN_RE = re.compile(r'@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# The local part starts with a letter or digit, never with '.', '-' or other punctuation
+EMAIL_LOCAL_PART_RE = re.compile(r'[A-Za-z0-9][A-Za-z0-9._%+-]*\Z')
+GITHUB_RE = re.compile(r'github\.com/[\w-]+/[\w.-]+', re.IGNORECASE)
+LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w%-]+', re.IGNORECASE)
+URL_PREFIX_RE = re.compile(r'(?:https?://)?(?:(?<![\w.-])(?:www|[a-z]{2})\.)?\Z', re.IGNORECASE)
+# Loose on purpose; candidates are filtered by digit count
+PHONE_RE = re.compile(r'[+(\d][\d \t().-]{8,}\d')
+LINK_TRAILING_CHARS = '.,;:!?)\']}">'
+
+# Lines that can't be a name: section keywords, contact details, digits, symbols
+NAME_SKIP_RE = re.compile(
+    r'resume|cv|curriculum|profile|contact|email|phone|address|objective|summary|experience'
+    r'|@|http|www\.|\d|[♂♀+\-()\[\]]',
+    re.IGNORECASE
+)
+NAME_FALLBACK_SPLIT_RE = re.compile(r'[♂♀+\-0-9()\[\]]')
+NAME_LINES_CHECKED = 10
+
+
+def _normalize_link(link: str) -> str:
+    link = link.strip(LINK_TRAILING_CHARS).rstrip('/')
+    if not link.lower().startswith('http'):
+        link = 'https://' + link
+    return link
+
+
+def _links(pattern: re.Pattern, text: str) -> List[str]:
+    links = {}
+    for match in pattern.finditer(text):
+        prefix = URL_PREFIX_RE.search(text, max(0, match.start() - 12), match.start())
+        links[_normalize_link(text[prefix.start():match.end()])] = None
+    return list(links)
+
+
+def _emails(text: str) -> List[str]:
+    emails = {}
+    for match in EMAIL_DOMAIN_RE.finditer(text):
+        local = EMAIL_LOCAL_PART_RE.search(text, max(0, match.start() - 64), match.start())
+        if local:
+            emails[local.group() + match.group()] = None
+    return list(emails)
+
+
+def _phones(text: str) -> List[str]:
+    phones = {}
+    for match in PHONE_RE.finditer(text):
+        start, number = match.start(), match.group()
+        # Digits glued to a word are part of an email, URL or ID, not a phone
+        if start and (text[start - 1].isalnum() or text[start - 1] in '._%+-/'):
+            continue
+        if 10 <= sum(map(str.isdigit, number)) <= 15:
+            phones[number] = None
+    return list(phones)
+
+
+def extract_contacts(text: str) -> Dict[str, List[str]]:
+    """Return every email, GitHub repo link, LinkedIn profile and phone number in the text.
+
+    Values are deduplicated (dicts as ordered sets) and kept in order of appearance.
+    """
+    return {
+        "emails": _emails(text),
+        "github_links": _links(GITHUB_RE, text),
+        "linkedin_links": _links(LINKEDIN_RE, text),
+        "phones": _phones(text),
+    }
 
 
 def extract_email(text: str) -> Optional[str]:
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
+    emails = _emails(text)
     return emails[0] if emails else None
 
 
 def extract_name(text: str) -> Optional[str]:
-    lines = text.strip().split('\n')
-    lines = [line.strip() for line in lines if line.strip()]
+    lines = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if line:
+            lines.append(line)
+            if len(lines) == NAME_LINES_CHECKED:
+                break
     
     if not lines:
         return None
     
-    for line in lines[:10]:  # Check more lines
-        # Skip lines with these keywords
-        if any(keyword in line.lower() for keyword in 
-               ['resume', 'cv', 'curriculum', 'profile', 'contact', 
-                'email', 'phone', 'address', 'objective', 'summary', 'experience']):
-            continue
-        
-        # Skip lines with email or URLs
-        if '@' in line or 'http' in line.lower() or 'www.' in line.lower():
-            continue
-        
-        # Skip lines with phone numbers (digits)
-        if any(char.isdigit() for char in line):
-            continue
-        
-        # Skip lines with special characters except spaces, periods, commas
-        if any(char in line for char in ['♂', '♀', '+', '-', '(', ')', '[', ']']):
+    for line in lines:
+        # Skip section keywords, emails/URLs, phone numbers and symbols
+        if NAME_SKIP_RE.search(line):
             continue
         
         words = line.split()
@@ -105,41 +194,37 @@ def extract_name(text: str) -> Optional[str]:
                 return line
     
     # Fallback: return first line and clean it
-    first_line = lines[0] if lines else None
-    if first_line:
-        # Remove everything after special characters or numbers
-        import re
-        cleaned = re.split(r'[♂♀+\-0-9()\[\]]', first_line)[0].strip()
-        return cleaned if cleaned else first_line
-    
-    return None
+    first_line = lines[0]
+    # Remove everything after special characters or numbers
+    cleaned = NAME_FALLBACK_SPLIT_RE.split(first_line)[0].strip()
+    return cleaned if cleaned else first_line
 
 
 def extract_github_links(text: str) -> List[str]:
-    github_links = []
-    
-    patterns = [
-        r'https?://(?:www\.)?github\.com/[\w-]+/[\w.-]+',
-        r'(?:www\.)?github\.com/[\w-]+/[\w.-]+',
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        github_links.extend(matches)
-    
-    cleaned_links = []
-    for link in github_links:
-        link = link.strip('.,;:!?)\']}">')
-        
-        if not link.startswith('http'):
-            link = 'https://' + link
-        
-        link = link.rstrip('/')
-        
-        if link not in cleaned_links:
-            cleaned_links.append(link)
-    
-    return cleaned_links
+    return _links(GITHUB_RE, text)
+
+
+GITHUB_REPO_RE = re.compile(r'github\.com/([\w-]+)/([\w.-]+)', re.IGNORECASE)
+# First path segments that are GitHub pages rather than users or orgs
+GITHUB_RESERVED_OWNERS = {
+    'orgs', 'settings', 'topics', 'features', 'marketplace', 'sponsors',
+    'about', 'pricing', 'login', 'explore', 'collections', 'trending',
+}
+
+
+def github_repo_from_link(link: str) -> Optional[Tuple[str, str]]:
+    """Return (owner, repo) for a link into a GitHub repository, or None.
+
+    Any sub-path (/tree/main, /blob/...) and a trailing .git are ignored;
+    profile links and GitHub's own pages give None.
+    """
+    match = GITHUB_REPO_RE.search(link)
+    if not match:
+        return None
+    owner, repo = match.group(1), match.group(2).removesuffix('.git').rstrip('.')
+    if not repo or owner.lower() in GITHUB_RESERVED_OWNERS:
+        return None
+    return owner, repo
 
 
 
@@ -0,0 +1,67 @@
+"""Single-flight request coalescing: concurrent callers with the same key share one call."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; later callers wait for its result.
+
+    The shared call is shielded, so a caller that disconnects doesn't cancel
+    the work the others are waiting on. Nothing is remembered once the call
+    finishes; pair it with a cache for that.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return `await fn()`, or the result of the identical call already in flight."""
+        call = self._calls.get(key)
+        if call is None:
+            self.leaders += 1
+            call = asyncio.ensure_future(fn())
+            self._track(key, call)
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(call)
+
+    def claim(self, key: Hashable) -> Optional[asyncio.Future]:
+        """Lead the call for `key` yourself, e.g. when the work is a stream.
+
+        Returns a future the caller must resolve (set_result/set_exception)
+        when done, or None if another caller already leads; use `join` then.
+        """
+        if key in self._calls:
+            return None
+        self.leaders += 1
+        call = asyncio.get_running_loop().create_future()
+        self._track(key, call)
+        return call
+
+    async def join(self, key: Hashable) -> Any:
+        """Wait for the call in flight for `key`; raises KeyError if there is none."""
+        call = self._calls[key]
+        self.coalesced += 1
+        return await asyncio.shield(call)
+
+    def _track(self, key: Hashable, call: asyncio.Future) -> None:
+        self._calls[key] = call
+
+        def finished(done: asyncio.Future) -> None:
+            if self._calls.get(key) is done:
+                del self._calls[key]
+            if not done.cancelled():
+                done.exception()  # retrieved here in case every waiter went away
+
+        call.add_done_callback(finished)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
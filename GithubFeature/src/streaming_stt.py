@@ -0,0 +1,256 @@
+"""Incremental speech-to-text: cut a live audio stream into segments and transcribe them in the background."""
+
+import array
+import asyncio
+import io
+import math
+import os
+import time
+import wave
+from typing import Awaitable, Callable, Dict, List, Optional, Protocol
+
+
+STREAM_STT_WINDOW_SECONDS = float(os.getenv("STREAM_STT_WINDOW_SECONDS", "5"))
+STREAM_STT_MAX_SEGMENT_SECONDS = float(os.getenv("STREAM_STT_MAX_SEGMENT_SECONDS", "15"))
+STREAM_STT_SILENCE_MS = int(os.getenv("STREAM_STT_SILENCE_MS", "600"))
+STREAM_STT_SILENCE_RMS = float(os.getenv("STREAM_STT_SILENCE_RMS", "500"))
+FRAME_MS = 30
+WEBM_CLUSTER_ID = b"\x1f\x43\xb6\x75"
+# MediaRecorder webm (cut at Clusters) or raw 16-bit mono PCM (cut at pauses)
+STREAM_AUDIO_FORMATS = ("webm", "pcm16")
+
+
+class Transcriber(Protocol):
+    async def transcribe(self, filename: str, content: bytes) -> str: ...
+
+
+class FakeTranscriber:
+    """Offline transcriber for tests and benchmarks (STT_TRANSCRIBER=fake).
+
+    Returns `responses` in order if given, otherwise a description of the
+    segment, after sleeping `latency` seconds.
+    """
+
+    def __init__(self, responses: Optional[List[str]] = None, latency: float = 0.0):
+        self.responses = list(responses or [])
+        self.latency = latency
+        self.calls: List[Dict] = []
+
+    async def transcribe(self, filename: str, content: bytes) -> str:
+        self.calls.append({"filename": filename, "bytes": len(content)})
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.responses:
+            return self.responses.pop(0)
+        return f"[segment {len(self.calls)}: {len(content)} bytes]"
+
+
+def pcm16_rms(frame: bytes) -> float:
+    """Root-mean-square amplitude of little-endian 16-bit PCM samples."""
+    samples = array.array('h')
+    samples.frombytes(frame[:len(frame) - len(frame) % 2])
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+
+def pcm16_to_wav(pcm: bytes, sample_rate: int, channels: int = 1) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+
+class PCMSegmenter:
+    """Cuts raw 16-bit mono PCM at pauses (energy VAD) or at a maximum length."""
+
+    extension = "wav"
+
+    def __init__(self, sample_rate: int = 16000,
+                 silence_ms: int = STREAM_STT_SILENCE_MS,
+                 silence_rms: float = STREAM_STT_SILENCE_RMS,
+                 max_segment_seconds: float = STREAM_STT_MAX_SEGMENT_SECONDS):
+        self.sample_rate = sample_rate
+        self.frame_bytes = sample_rate * FRAME_MS // 1000 * 2
+        self.silence_frames = max(1, silence_ms // FRAME_MS)
+        self.silence_rms = silence_rms
+        self.max_frames = int(max_segment_seconds * 1000 / FRAME_MS)
+        self._pending = b""
+        self._frames: List[bytes] = []
+        self._voiced = False
+        self._trailing_silence = 0
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Add audio and return any segments completed by it."""
+        data = self._pending + chunk
+        usable = len(data) - len(data) % self.frame_bytes
+        self._pending = data[usable:]
+
+        segments = []
+        for offset in range(0, usable, self.frame_bytes):
+            frame = data[offset:offset + self.frame_bytes]
+            self._frames.append(frame)
+            if pcm16_rms(frame) >= self.silence_rms:
+                self._voiced = True
+                self._trailing_silence = 0
+            else:
+                self._trailing_silence += 1
+
+            paused = self._voiced and self._trailing_silence >= self.silence_frames
+            if paused or len(self._frames) >= self.max_frames:
+                segment = self._cut()
+                if segment:
+                    segments.append(segment)
+        return segments
+
+    def flush(self) -> Optional[bytes]:
+        if self._pending:
+            self._frames.append(self._pending)
+            self._pending = b""
+        return self._cut()
+
+    def _cut(self) -> Optional[bytes]:
+        frames, voiced = self._frames, self._voiced
+        self._frames, self._voiced, self._trailing_silence = [], False, 0
+        if not voiced:
+            return None  # pure silence is never sent to the API
+        return pcm16_to_wav(b"".join(frames), self.sample_rate)
+
+
+class ContainerSegmenter:
+    """Cuts a compressed recording (webm from MediaRecorder) on a fixed time window.
+
+    MediaRecorder chunks don't line up with the container, so each cut is
+    made at the last Cluster that has started in the buffered bytes and the
+    rest is carried into the next segment. Segments after the first get the
+    header (the bytes before the first Cluster) prepended, so every segment
+    is a header followed by whole Clusters.
+    """
+
+    def __init__(self, extension: str = "webm", window_seconds: float = STREAM_STT_WINDOW_SECONDS):
+        self.extension = extension
+        self.window_seconds = window_seconds
+        self._header: Optional[bytes] = None
+        self._buffer = bytearray()
+        self._emitted = False
+        self._window_started = time.monotonic()
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        self._buffer += chunk
+        if self._header is None:
+            cluster_at = self._buffer.find(WEBM_CLUSTER_ID)
+            if cluster_at < 0:
+                return []  # still inside the header
+            self._header = bytes(self._buffer[:cluster_at])
+            self._window_started = time.monotonic()
+        if time.monotonic() - self._window_started >= self.window_seconds:
+            segment = self._cut()
+            if segment:
+                return [segment]
+        return []
+
+    def flush(self) -> Optional[bytes]:
+        if not self._buffer:
+            return None
+        return self._segment(len(self._buffer))
+
+    def _cut(self) -> Optional[bytes]:
+        # The first segment begins with the header, later ones with a Cluster
+        first_cluster_at = 0 if self._emitted else len(self._header)
+        cut_at = self._buffer.rfind(WEBM_CLUSTER_ID, first_cluster_at + 1)
+        if cut_at < 0:
+            return None  # a single Cluster so far; wait for the next one to start
+        return self._segment(cut_at)
+
+    def _segment(self, end: int) -> bytes:
+        prefix = self._header if self._emitted and self._header else b""
+        segment = prefix + bytes(self._buffer[:end])
+        del self._buffer[:end]
+        self._emitted = True
+        self._window_started = time.monotonic()
+        return segment
+
+
+class StreamingTranscriptionSession:
+    """Transcribes segments in the background as audio arrives.
+
+    `on_update` is awaited with a message dict whenever a segment finishes:
+    {"type": "partial", "segment": i, "text": ..., "transcript": <all text so far, in order>}.
+    """
+
+    def __init__(self, transcriber: Transcriber, audio_format: str = "webm",
+                 sample_rate: int = 16000,
+                 on_update: Optional[Callable[[Dict], Awaitable[None]]] = None):
+        if audio_format not in STREAM_AUDIO_FORMATS:
+            raise ValueError(f"Unsupported streaming audio format: {audio_format}")
+        if audio_format == "pcm16":
+            self.segmenter = PCMSegmenter(sample_rate=sample_rate)
+        else:
+            self.segmenter = ContainerSegmenter(extension=audio_format)
+        self.transcriber = transcriber
+        self.on_update = on_update
+        self.bytes_received = 0
+        self._tasks: List[asyncio.Task] = []
+        self._texts: Dict[int, str] = {}
+
+    async def feed(self, chunk: bytes) -> None:
+        self.bytes_received += len(chunk)
+        for segment in self.segmenter.feed(chunk):
+            self._schedule(segment)
+
+    async def finish(self) -> Dict:
+        """Transcribe whatever is left and return the final transcript."""
+        tail = self.segmenter.flush()
+        if tail:
+            self._schedule(tail)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        return {
+            "type": "final",
+            "text": self._transcript(),
+            "segments": len(self._tasks),
+        }
+
+    def cancel(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+    def _schedule(self, segment: bytes) -> None:
+        index = len(self._tasks)
+        filename = f"segment_{index}.{self.segmenter.extension}"
+        self._tasks.append(asyncio.create_task(self._transcribe(index, filename, segment)))
+
+    async def _transcribe(self, index: int, filename: str, segment: bytes) -> None:
+        try:
+            text = (await self.transcriber.transcribe(filename, segment)).strip()
+        except Exception as exc:
+            print(f"❌ Streaming STT segment {index} failed: {exc}")
+            self._texts[index] = ""
+            await self._notify({"type": "error", "segment": index, "detail": str(exc)})
+            return
+
+        self._texts[index] = text
+        await self._notify({
+            "type": "partial",
+            "segment": index,
+            "text": text,
+            "transcript": self._transcript(),
+        })
+
+    def _transcript(self) -> str:
+        # Only the contiguous prefix of finished segments, so text never reorders
+        parts = []
+        for index in range(len(self._tasks)):
+            if index not in self._texts:
+                break
+            parts.append(self._texts[index])
+        return " ".join(part for part in parts if part)
+
+    async def _notify(self, message: Dict) -> None:
+        if self.on_update is not None:
+            try:
+                await self.on_update(message)
+            except Exception as exc:
+                print(f"⚠️  Could not deliver streaming STT update: {exc}")
@@ -0,0 +1,110 @@
+"""Line-streaming README normalizer: drops HTML, badges, images and markup noise, stops at a size cap."""
+
+import html
+import io
+import re
+from typing import Iterator, Optional
+
+
+# Code blocks are kept (they show the stack) but long ones are cut short
+CODE_BLOCK_MAX_LINES = 15
+
+HTML_COMMENT = re.compile(r"<!--.*?-->", re.S)
+HTML_TAG = re.compile(r"<[^>\n]*>")
+# A tag still open at the end of a line, e.g. `<img src="..."` with `width="200">` below
+OPEN_TAG = re.compile(r"</?[a-z][a-z0-9-]*(?:\s[^<>]*)?$")
+# Stop skipping lines for a tag that hasn't closed after this many (it was probably prose)
+OPEN_TAG_MAX_LINES = 10
+# [![alt](image)](link) badges, then any remaining ![alt](image)
+BADGE = re.compile(r"\[!\[[^\]]*\]\([^)]*\)\]\([^)]*\)")
+IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+LINK = re.compile(r"\[([^\]]+)\]\([^)]*\)")
+REFERENCE_DEFINITION = re.compile(r"^\s*\[[^\]]+\]:\s*\S+")
+# Horizontal rules and table separator rows
+RULE = re.compile(r"^\s*(?:[-*_=]\s*){3,}$|^\s*\|?(?:\s*:?-+:?\s*\|)+\s*:?-*:?\s*$")
+EMPHASIS = re.compile(r"(\*\*|__|~~)(?=\S)(.+?)(?<=\S)\1")
+SPACES = re.compile(r"[ \t\u00a0]+")
+FENCE = re.compile(r"^\s*(```|~~~)")
+
+
+def _clean_lines(text: str) -> Iterator[str]:
+    """Yield normalized lines; blank lines are yielded as '' and collapsed by the caller."""
+    in_code = False
+    code_lines = 0
+    in_comment = False
+    in_tag = 0  # lines spent inside an unclosed HTML tag
+
+    for raw in io.StringIO(text):
+        line = raw.rstrip("\r\n")
+
+        if FENCE.match(line):
+            in_code, code_lines = not in_code, 0
+            continue
+        if in_code:
+            code_lines += 1
+            if code_lines <= CODE_BLOCK_MAX_LINES:
+                yield SPACES.sub(" ", line.rstrip())
+            elif code_lines == CODE_BLOCK_MAX_LINES + 1:
+                yield "..."
+            continue
+
+        # Multi-line HTML comments
+        if in_comment:
+            end = line.find("-->")
+            if end < 0:
+                continue
+            line, in_comment = line[end + 3:], False
+        line = HTML_COMMENT.sub("", line)
+        start = line.find("<!--")
+        if start >= 0:
+            line, in_comment = line[:start], True
+
+        # Multi-line HTML tags
+        if in_tag:
+            end = line.find(">")
+            if end < 0:
+                in_tag = in_tag + 1 if in_tag < OPEN_TAG_MAX_LINES else 0
+                continue
+            line, in_tag = line[end + 1:], 0
+
+        if REFERENCE_DEFINITION.match(line) or RULE.match(line):
+            continue
+
+        line = BADGE.sub("", line)
+        line = IMAGE.sub("", line)
+        line = LINK.sub(r"\1", line)
+        line = HTML_TAG.sub(" ", line)
+        open_tag = OPEN_TAG.search(line)
+        if open_tag:
+            line, in_tag = line[:open_tag.start()], 1
+        line = EMPHASIS.sub(r"\2", line)
+        if "&" in line:
+            line = html.unescape(line)
+        yield SPACES.sub(" ", line).strip()
+
+
+def clean_markdown(text: str, max_chars: Optional[int] = None) -> str:
+    """Return README text stripped of HTML and markdown noise, at most `max_chars` long.
+
+    Works line by line and stops as soon as the cap is reached, so a huge
+    README costs no more than the part that is kept.
+    """
+    out = []
+    size = 0
+    blank = True  # also drops leading blank lines
+    for line in _clean_lines(text):
+        if not line:
+            if blank:
+                continue
+            blank = True
+        else:
+            blank = False
+        out.append(line)
+        size += len(line) + 1
+        if max_chars is not None and size >= max_chars:
+            break
+
+    cleaned = "\n".join(out).strip()
+    if max_chars is not None and len(cleaned) > max_chars:
+        cleaned = cleaned[:max_chars]
+    return cleaned
@@ -1,15 +1,34 @@
 """Voice service for text-to-speech and speech-to-text using ElevenLabs and Groq."""
 
+import asyncio
+import hashlib
+import json
 import os
+import random
+import re
 import tempfile
-from collections.abc import Iterator
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from functools import lru_cache
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException, File, UploadFile
-from fastapi.responses import StreamingResponse
+import anyio
+
+from fastapi import APIRouter, HTTPException, File, Request, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
-from groq import Groq
+from groq import AsyncGroq
+
+from src.audio_preprocess import preprocess_audio
+from src.limiter import ConcurrencyLimiter
+from src.metrics import observe_stage, stage
+from src.singleflight import SingleFlight
+from src.streaming_stt import FakeTranscriber, StreamingTranscriptionSession, STREAM_AUDIO_FORMATS
+from src.uploads import read_upload, MAX_AUDIO_UPLOAD_BYTES
 
 # Create router
 router = APIRouter(prefix="/voice", tags=["voice"])
@@ -19,6 +38,38 @@ DEFAULT_TTS_VOICE = os.getenv("GROQ_TTS_VOICE", "Aaliyah-PlayAI")
 DEFAULT_TTS_MODEL = os.getenv("GROQ_TTS_MODEL", "playai-tts")
 DEFAULT_TTS_FORMAT = os.getenv("GROQ_TTS_FORMAT", "mp3")
 
+TTS_CHUNK_SIZE = 16384
+
+AUDIO_MEDIA_TYPES = {"mp3": "audio/mpeg", "wav": "audio/wav", "pcm": "audio/L16"}
+
+# On-disk TTS audio cache
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "sarthi_tts_cache"))
+TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# How long a request waits on an identical in-flight synthesis before doing its own
+TTS_COALESCE_WAIT_SECONDS = float(os.getenv("TTS_COALESCE_WAIT_SECONDS", "30"))
+# Groq Whisper STT: concurrency cap, per-request timeout and rate-limit backoff
+STT_MODEL = os.getenv("GROQ_STT_MODEL", "whisper-large-v3-turbo")
+STT_MAX_CONCURRENCY = int(os.getenv("STT_MAX_CONCURRENCY", "8"))
+STT_TIMEOUT_SECONDS = float(os.getenv("STT_TIMEOUT_SECONDS", "60"))
+STT_MAX_RETRIES = int(os.getenv("STT_MAX_RETRIES", "4"))
+STT_BACKOFF_BASE_SECONDS = float(os.getenv("STT_BACKOFF_BASE_SECONDS", "1"))
+STT_BACKOFF_MAX_SECONDS = float(os.getenv("STT_BACKOFF_MAX_SECONDS", "20"))
+STT_DISCONNECT_POLL_SECONDS = 0.5
+# Trim silence and downmix to 16 kHz mono before upload (per request: ?preprocess=true|false)
+STT_PREPROCESS = os.getenv("STT_PREPROCESS", "false").lower() == "true"
+
+# Pipelined (sentence-chunked) synthesis; only formats whose segments can be
+# concatenated into one playable stream are eligible
+TTS_PIPELINE_CONCURRENCY = int(os.getenv("TTS_PIPELINE_CONCURRENCY", "3"))
+TTS_PIPELINE_MIN_SEGMENT_CHARS = int(os.getenv("TTS_PIPELINE_MIN_SEGMENT_CHARS", "40"))
+PIPELINE_FORMATS = {"mp3"}
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+TTS_WARMUP_PHRASES_FILE = os.getenv(
+    "TTS_WARMUP_PHRASES_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "tts_warmup_phrases.txt")
+)
+
 
 class SpeechRequest(BaseModel):
     """Payload for generating speech audio using Groq TTS."""
@@ -34,18 +85,197 @@ class SpeechRequest(BaseModel):
         None,
         description="Audio format: mp3, wav, pcm"
     )
+    pipelined: bool = Field(
+        False,
+        description="Synthesize sentence by sentence and stream each as soon as it is ready (mp3 only)"
+    )
+
+
+class TTSAudioCache:
+    """Content-addressed, size-bounded LRU store of synthesized audio files.
+
+    Entries are keyed by a hash of (text, voice, model, format) and live as
+    plain files so hits can be served with FileResponse (sendfile where the
+    server supports it). The index is rebuilt from file mtimes on startup.
+    """
+
+    def __init__(self, directory: str = TTS_CACHE_DIR, max_bytes: int = TTS_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+
+        os.makedirs(directory, exist_ok=True)
+        files = []
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if name.startswith("tmp") or not os.path.isfile(path):
+                continue
+            stat = os.stat(path)
+            files.append((stat.st_mtime, name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._size += size
+        self._evict()
+
+    @staticmethod
+    def key(text: str, voice: str, model: str, audio_format: str) -> str:
+        digest = hashlib.sha256(json.dumps([text, voice, model, audio_format]).encode()).hexdigest()
+        return f"{digest}.{audio_format}"
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def lookup(self, key: str) -> str | None:
+        """Return the cached file path for `key`, marking it recently used."""
+        with self._lock:
+            path = self.path_for(key)
+            if key not in self._entries or not os.path.exists(path):
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        os.utime(path)
+        return path
+
+    def temp_path(self, audio_format: str) -> str:
+        """Reserve a temp file inside the cache dir so `store` can rename atomically."""
+        fd, path = tempfile.mkstemp(prefix="tmp", suffix=f".{audio_format}", dir=self.directory)
+        os.close(fd)
+        return path
+
+    def store(self, tmp_path: str, key: str) -> str:
+        """Move a fully written temp file into the cache and evict if over budget."""
+        path = self.path_for(key)
+        os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+        with self._lock:
+            self._size -= self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._size += size
+            self._evict()
+        return path
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            old_key, old_size = self._entries.popitem(last=False)
+            self._size -= old_size
+            self.evictions += 1
+            try:
+                os.unlink(self.path_for(old_key))
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class LatencyStats:
+    """Running count/avg/max/last of a latency measured in milliseconds."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = None
+
+    def record(self, ms: float) -> None:
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.last_ms = ms
+
+    def stats(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "max_ms": round(self.max_ms, 1),
+            "last_ms": round(self.last_ms, 1) if self.last_ms is not None else None,
+        }
+
+
+# Time-to-first-byte of uncached /voice/tts responses
+tts_latency = LatencyStats()
+
+# Identical texts requested concurrently are synthesized once, keyed by cache key
+tts_flight = SingleFlight("tts")
 
 
 @lru_cache(maxsize=1)
-def get_groq_client() -> Groq:
-    """Return a cached Groq client configured from the environment."""
+def get_tts_cache() -> TTSAudioCache:
+    """Return the shared TTS audio cache."""
+    return TTSAudioCache()
+
+
+def resolve_tts_options(request: SpeechRequest) -> tuple[str, str, str]:
+    """Return (voice, model, format) with defaults applied."""
+    return (
+        request.voice or DEFAULT_TTS_VOICE,
+        request.model or DEFAULT_TTS_MODEL,
+        request.response_format or DEFAULT_TTS_FORMAT,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_groq_client() -> AsyncGroq:
+    """Return a cached async Groq client configured from the environment."""
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         raise RuntimeError("GROQ_API_KEY is not set")
-    return Groq(api_key=api_key)
+    return AsyncGroq(api_key=api_key)
+
+
+async def stream_synthesis(text: str, voice: str, model: str, audio_format: str) -> AsyncIterator[bytes]:
+    """Yield Groq TTS audio chunks as they arrive, teeing them into the TTS cache.
+    
+    The partial cache file is removed if synthesis fails or the client goes away.
+    """
+    client = get_async_groq_client()
+    cache = get_tts_cache()
+    tmp_path = cache.temp_path(audio_format)
+    completed = False
+    
+    try:
+        # Call Groq TTS API with a streaming response instead of buffering it
+        async with client.audio.speech.with_streaming_response.create(
+            model=model,
+            voice=voice,
+            response_format=audio_format,
+            input=text
+        ) as response:
+            async with await anyio.open_file(tmp_path, 'wb') as cache_file:
+                async for chunk in response.iter_bytes(TTS_CHUNK_SIZE):
+                    await cache_file.write(chunk)
+                    yield chunk
+        
+        cache.store(tmp_path, TTSAudioCache.key(text, voice, model, audio_format))
+        completed = True
+    finally:
+        if not completed:
+            await anyio.Path(tmp_path).unlink(missing_ok=True)
+
+
+async def synthesize_to_cache(text: str, voice: str, model: str, audio_format: str) -> str:
+    """Call Groq TTS and store the audio in the TTS cache, returning its path."""
+    async with aclosing(stream_synthesis(text, voice, model, audio_format)) as chunks:
+        async for _ in chunks:
+            pass
+    return get_tts_cache().path_for(TTSAudioCache.key(text, voice, model, audio_format))
 
 
-def build_audio_stream(request: SpeechRequest) -> Iterator[bytes]:
+async def build_audio_stream(request: SpeechRequest) -> AsyncIterator[bytes]:
     """Generate speech audio using Groq TTS and stream it."""
     
     # Check if mock mode is enabled (for testing without rate limits)
@@ -56,37 +286,13 @@ def build_audio_stream(request: SpeechRequest) -> Iterator[bytes]:
         yield b''
         return
     
-    client = get_groq_client()
-    voice = request.voice or DEFAULT_TTS_VOICE
-    model = request.model or DEFAULT_TTS_MODEL
-    audio_format = request.response_format or DEFAULT_TTS_FORMAT
+    voice, model, audio_format = resolve_tts_options(request)
     
     try:
-        # Call Groq TTS API
-        response = client.audio.speech.create(
-            model=model,
-            voice=voice,
-            response_format=audio_format,
-            input=request.text
-        )
-        
-        # Write to a temporary file first, then stream it
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{audio_format}") as tmp:
-            tmp_path = tmp.name
-        
-        # Use Groq's write_to_file method
-        response.write_to_file(tmp_path)
-        
-        # Now read and stream the file with larger chunks for smoother playback
-        with open(tmp_path, 'rb') as audio_file:
-            while True:
-                chunk = audio_file.read(16384)  # 16KB chunks for smoother audio
-                if not chunk:
-                    break
+        # Forward chunks as Groq produces them (16KB chunks for smoother audio)
+        async with aclosing(stream_synthesis(request.text, voice, model, audio_format)) as chunks:
+            async for chunk in chunks:
                 yield chunk
-        
-        # Cleanup
-        os.unlink(tmp_path)
                 
     except Exception as exc:
         import groq
@@ -99,58 +305,446 @@ def build_audio_stream(request: SpeechRequest) -> Iterator[bytes]:
             raise HTTPException(status_code=502, detail=str(exc)) from exc
 
 
+def split_sentences(text: str, min_chars: int = TTS_PIPELINE_MIN_SEGMENT_CHARS) -> list[str]:
+    """Split text at sentence boundaries, merging short sentences into the next one."""
+    segments = []
+    pending = ""
+    for sentence in SENTENCE_BOUNDARY.split(text.strip()):
+        pending = f"{pending} {sentence}".strip() if pending else sentence
+        if len(pending) >= min_chars:
+            segments.append(pending)
+            pending = ""
+    if pending:
+        if segments and len(pending) < min_chars:
+            segments[-1] = f"{segments[-1]} {pending}"
+        else:
+            segments.append(pending)
+    return segments
+
+
+async def build_pipelined_stream(
+    text: str, voice: str, model: str, audio_format: str
+) -> AsyncIterator[bytes]:
+    """Synthesize sentences concurrently and stream them back in order.
+    
+    Up to TTS_PIPELINE_CONCURRENCY segments are synthesized at once; each is
+    sent as soon as it and every segment before it are ready. Segments go
+    through the TTS cache, so sentences repeated across questions are reused.
+    """
+    import groq
+    cache = get_tts_cache()
+    semaphore = asyncio.Semaphore(TTS_PIPELINE_CONCURRENCY)
+    
+    async def render(segment: str) -> str:
+        cache_key = TTSAudioCache.key(segment, voice, model, audio_format)
+        cached_path = cache.lookup(cache_key)
+        if cached_path:
+            return cached_path
+        async with semaphore:
+            path = await tts_flight.do(
+                cache_key, lambda: synthesize_to_cache(segment, voice, model, audio_format)
+            )
+            # A joined /voice/tts leader resolves None when its stream failed or was cut short
+            if not path or not os.path.exists(path):
+                path = await synthesize_to_cache(segment, voice, model, audio_format)
+            return path
+    
+    segments = split_sentences(text)
+    tasks = [asyncio.create_task(render(segment)) for segment in segments]
+    try:
+        for index, task in enumerate(tasks):
+            try:
+                path = await task
+            except groq.RateLimitError as exc:
+                print(f"⚠️  Groq TTS rate limit hit on segment {index + 1}/{len(tasks)}: {exc}")
+                # Return what we have (or silence) - let interview continue
+                yield b''
+                return
+            except Exception as exc:
+                if index == 0:
+                    raise HTTPException(status_code=502, detail=str(exc)) from exc
+                print(f"❌ TTS segment {index + 1}/{len(tasks)} failed, truncating audio: {exc}")
+                return
+            yield await anyio.Path(path).read_bytes()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def resolve_flight_when_done(
+    audio_stream: AsyncIterator[bytes], flight: asyncio.Future, cache_key: str
+) -> AsyncIterator[bytes]:
+    """Pass chunks through, then hand waiting requests the cached file (None if it wasn't stored)."""
+    try:
+        async for chunk in audio_stream:
+            yield chunk
+    finally:
+        await audio_stream.aclose()
+        if not flight.done():
+            path = get_tts_cache().path_for(cache_key)
+            flight.set_result(path if os.path.exists(path) else None)
+
+
 @router.post("/tts", response_class=StreamingResponse)
 async def text_to_speech(request: SpeechRequest) -> StreamingResponse:
-    """Stream Groq TTS audio generated from the provided text."""
-    audio_stream = build_audio_stream(request)
-    return StreamingResponse(audio_stream, media_type="audio/mpeg")
+    """Stream Groq TTS audio generated from the provided text.
+    
+    Previously synthesized (text, voice, model, format) combinations are served
+    straight from the on-disk audio cache without calling Groq. Otherwise audio
+    is forwarded chunk by chunk while Groq is still synthesizing it. With
+    `pipelined: true` long texts are synthesized sentence by sentence so the
+    first sentence plays while later ones are still being generated.
+    
+    If the same audio is already being synthesized for another request, this
+    one waits for it and is served from the cache instead of calling Groq.
+    """
+    voice, model, audio_format = resolve_tts_options(request)
+    media_type = AUDIO_MEDIA_TYPES.get(audio_format, "audio/mpeg")
+    cache_key = TTSAudioCache.key(request.text, voice, model, audio_format)
+    pipelined = request.pipelined and audio_format in PIPELINE_FORMATS
+    
+    mock_mode = os.getenv("MOCK_TTS", "false").lower() == "true"
+    flight = None
+    if not mock_mode:
+        cached_path = get_tts_cache().lookup(cache_key)
+        if cached_path:
+            return FileResponse(cached_path, media_type=media_type)
+        
+        if not pipelined:
+            flight = tts_flight.claim(cache_key)
+            if flight is None:
+                # The leader resolves with the cached path, or None if it failed
+                try:
+                    cached_path = await asyncio.wait_for(
+                        tts_flight.join(cache_key), timeout=TTS_COALESCE_WAIT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    cached_path = None
+                if cached_path and os.path.exists(cached_path):
+                    return FileResponse(cached_path, media_type=media_type)
+                flight = tts_flight.claim(cache_key)
+    
+    # Wait for the first chunk before responding so errors still map to a
+    # proper status code and time-to-first-byte can go in a header
+    started = time.perf_counter()
+    if pipelined and not mock_mode:
+        audio_stream = build_pipelined_stream(request.text, voice, model, audio_format)
+    else:
+        audio_stream = build_audio_stream(request)
+    if flight is not None:
+        audio_stream = resolve_flight_when_done(audio_stream, flight, cache_key)
+    first_chunk = await anext(audio_stream, b'')
+    ttfb_ms = (time.perf_counter() - started) * 1000
+    tts_latency.record(ttfb_ms)
+    observe_stage("tts_ttfb", ttfb_ms / 1000)
+    print(f"[TTS] First byte after {ttfb_ms:.0f} ms")
+    
+    async def forward_chunks():
+        try:
+            yield first_chunk
+            async for chunk in audio_stream:
+                yield chunk
+        finally:
+            await audio_stream.aclose()
+    
+    return StreamingResponse(
+        forward_chunks(),
+        media_type=media_type,
+        headers={"X-TTS-TTFB-Ms": f"{ttfb_ms:.1f}"}
+    )
+
+
+def load_warmup_phrases(path: str = TTS_WARMUP_PHRASES_FILE) -> list[str]:
+    """Read one phrase per line, skipping blanks and # comments."""
+    if not path or not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+async def warm_tts_cache(phrases: list[str] | None = None) -> int:
+    """Pre-render phrases into the TTS cache so they cost no API call later.
+    
+    Runs at startup when TTS_WARMUP=true. Returns how many phrases were synthesized.
+    """
+    if phrases is None:
+        phrases = load_warmup_phrases()
+    
+    cache = get_tts_cache()
+    rendered = 0
+    for phrase in phrases:
+        key = TTSAudioCache.key(phrase, DEFAULT_TTS_VOICE, DEFAULT_TTS_MODEL, DEFAULT_TTS_FORMAT)
+        if os.path.exists(cache.path_for(key)):
+            continue
+        try:
+            await synthesize_to_cache(
+                phrase, DEFAULT_TTS_VOICE, DEFAULT_TTS_MODEL, DEFAULT_TTS_FORMAT
+            )
+            rendered += 1
+        except Exception as exc:
+            print(f"⚠️  TTS warm-up failed for '{phrase[:40]}...': {exc}")
+            break
+    print(f"[TTS warm-up] Pre-rendered {rendered} of {len(phrases)} phrases")
+    return rendered
+
+
+class STTStats:
+    """Counters for transcription outcomes beyond what the limiter tracks."""
+
+    def __init__(self):
+        self.rate_limited = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.failures = 0
+        self.preprocessed = 0
+        self.preprocess_bytes_saved = 0
+        self.preprocess_seconds_saved = 0.0
+
+    def record_preprocess(self, report: dict) -> None:
+        if report.get("applied"):
+            self.preprocessed += 1
+            self.preprocess_bytes_saved += report["bytes_saved"]
+            self.preprocess_seconds_saved += report["duration_saved_s"]
+
+    def stats(self) -> dict:
+        return {
+            "rate_limited": self.rate_limited,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "failures": self.failures,
+            "preprocessed": self.preprocessed,
+            "preprocess_bytes_saved": self.preprocess_bytes_saved,
+            "preprocess_seconds_saved": round(self.preprocess_seconds_saved, 2),
+        }
+
+
+stt_limiter = ConcurrencyLimiter("stt", STT_MAX_CONCURRENCY)
+stt_stats = STTStats()
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float:
+    """Honor Groq's Retry-After header, else back off exponentially with jitter."""
+    response = getattr(exc, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        if retry_after is not None:
+            return min(float(retry_after), STT_BACKOFF_MAX_SECONDS)
+    except ValueError:
+        pass
+    backoff = STT_BACKOFF_BASE_SECONDS * (2 ** attempt)
+    return min(backoff + random.uniform(0, STT_BACKOFF_BASE_SECONDS), STT_BACKOFF_MAX_SECONDS)
+
+
+async def transcribe_audio(filename: str, content: bytes) -> str:
+    """Transcribe audio with Groq Whisper without blocking the event loop.
+    
+    At most STT_MAX_CONCURRENCY transcriptions run at once; the rest queue.
+    A rate-limited request gives up its slot, sleeps, and rejoins the queue,
+    up to STT_MAX_RETRIES times before the RateLimitError is raised.
+    """
+    import groq
+    # Retries are handled here, through the queue, rather than inside the SDK
+    client = get_async_groq_client().with_options(max_retries=0)
+    
+    for attempt in range(STT_MAX_RETRIES + 1):
+        async with stt_limiter.slot():
+            try:
+                with stage("stt"):
+                    transcription = await client.audio.transcriptions.create(
+                        file=(filename, content),
+                        model=STT_MODEL,
+                        temperature=0,
+                        response_format="json"
+                    )
+                return transcription.text
+            except groq.RateLimitError as exc:
+                stt_stats.rate_limited += 1
+                if attempt == STT_MAX_RETRIES:
+                    raise
+                delay = _retry_delay(exc, attempt)
+        
+        print(f"⚠️  Groq STT rate limited, retrying in {delay:.1f}s (attempt {attempt + 1}/{STT_MAX_RETRIES})")
+        await asyncio.sleep(delay)
+
+
+async def _cancel_on_disconnect(request: Request, task: asyncio.Task) -> None:
+    """Cancel `task` if the client hangs up before it finishes."""
+    while not task.done():
+        if await request.is_disconnected():
+            task.cancel()
+            return
+        await asyncio.sleep(STT_DISCONNECT_POLL_SECONDS)
 
 
 @router.post("/stt")
-async def speech_to_text(audio: UploadFile = File(...)) -> dict:
+async def speech_to_text(request: Request, audio: UploadFile = File(...),
+                         preprocess: Optional[bool] = None) -> dict:
     """Convert speech audio to text using Groq Whisper.
     
     Accepts audio files in various formats (webm, mp3, m4a, wav, etc.)
-    Returns the transcribed text.
+    Returns the transcribed text. Transcriptions are capped at
+    STT_TIMEOUT_SECONDS and abandoned if the client disconnects.
+    
+    With preprocessing (STT_PREPROCESS, or ?preprocess=true) silence is
+    trimmed and the audio is downmixed to 16 kHz mono before upload; the
+    response then includes a "preprocessing" report with the savings.
     """
+    import groq
     try:
-        # Save uploaded file temporarily
-        suffix = os.path.splitext(audio.filename)[1] if audio.filename else ".webm"
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            content = await audio.read()
-            tmp.write(content)
-            tmp_path = tmp.name
+        # Hand the upload buffer straight to Groq, no temp file round trip
+        filename = audio.filename or "audio.webm"
+        content = await read_upload(audio, MAX_AUDIO_UPLOAD_BYTES)
         
-        # Call Groq STT
-        client = get_groq_client()
-        with open(tmp_path, "rb") as file:
-            transcription = client.audio.transcriptions.create(
-                file=(tmp_path, file.read()),
-                model="whisper-large-v3-turbo",
-                temperature=0,
-                response_format="json"
-            )
+        report = None
+        if STT_PREPROCESS if preprocess is None else preprocess:
+            with stage("stt_preprocess"):
+                filename, content, report = await anyio.to_thread.run_sync(preprocess_audio, filename, content)
+            stt_stats.record_preprocess(report)
         
-        # Cleanup
-        os.unlink(tmp_path)
+        # Call Groq STT
+        task = asyncio.create_task(
+            asyncio.wait_for(transcribe_audio(filename, content), timeout=STT_TIMEOUT_SECONDS)
+        )
+        watcher = asyncio.create_task(_cancel_on_disconnect(request, task))
+        try:
+            text = await task
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise  # the server is cancelling us, not a client disconnect
+            stt_stats.cancelled += 1
+            raise HTTPException(status_code=499, detail="Client disconnected")
+        finally:
+            watcher.cancel()
         
-        return {
-            "text": transcription.text,
+        result = {
+            "text": text,
             "status": "success"
         }
+        if report is not None:
+            result["preprocessing"] = report
+        return result
         
+    except HTTPException:
+        raise
+    except asyncio.TimeoutError:
+        stt_stats.timeouts += 1
+        raise HTTPException(status_code=504, detail=f"STT timed out after {STT_TIMEOUT_SECONDS:g}s")
+    except groq.RateLimitError:
+        raise HTTPException(
+            status_code=429,
+            detail="STT rate limit reached, please retry shortly",
+            headers={"Retry-After": str(int(STT_BACKOFF_MAX_SECONDS))}
+        )
     except Exception as e:
-        # Cleanup on error
-        if 'tmp_path' in locals() and os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+        stt_stats.failures += 1
         raise HTTPException(status_code=500, detail=f"STT error: {str(e)}")
 
 
+class GroqTranscriber:
+    """Transcriber backed by transcribe_audio (AsyncGroq + STT limiter)."""
+
+    async def transcribe(self, filename: str, content: bytes) -> str:
+        return await asyncio.wait_for(transcribe_audio(filename, content), timeout=STT_TIMEOUT_SECONDS)
+
+
+def get_transcriber():
+    """Return the streaming transcriber; STT_TRANSCRIBER=fake selects the offline one."""
+    if os.getenv("STT_TRANSCRIBER", "groq").lower() == "fake":
+        return FakeTranscriber()
+    return GroqTranscriber()
+
+
+@router.websocket("/stt/stream")
+async def speech_to_text_stream(websocket: WebSocket) -> None:
+    """Transcribe an answer while it is being recorded.
+    
+    Protocol:
+      -> optional {"type": "start", "format": "webm" | "pcm16", "sample_rate": 16000}, before any audio
+      -> binary audio chunks as they are recorded (MediaRecorder webm by default)
+      <- {"type": "partial", "segment": i, "text": ..., "transcript": ...} per segment
+      -> {"type": "stop"} when the candidate stops talking
+      <- {"type": "final", "text": ..., "segments": n}, then the socket closes
+    
+    webm is cut every STREAM_STT_WINDOW_SECONDS; pcm16 (16-bit mono) is cut at
+    pauses, so only the last short segment is left to transcribe at "stop".
+    """
+    await websocket.accept()
+    session = None
+    
+    async def send_update(message: dict) -> None:
+        await websocket.send_json(message)
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            
+            if message.get("bytes") is not None:
+                if session is None:
+                    session = StreamingTranscriptionSession(get_transcriber(), on_update=send_update)
+                await session.feed(message["bytes"])
+                if session.bytes_received > MAX_AUDIO_UPLOAD_BYTES:
+                    await websocket.send_json({"type": "error", "detail": "Audio stream too large"})
+                    await websocket.close(code=1009)
+                    break
+                continue
+            
+            try:
+                control = json.loads(message.get("text") or "{}")
+            except json.JSONDecodeError:
+                control = None
+            if not isinstance(control, dict):
+                await websocket.send_json({"type": "error", "detail": "Control messages must be JSON objects"})
+                continue
+            
+            if control.get("type") == "start":
+                # Audio already received (or an earlier start) fixed the format for this answer
+                if session is not None:
+                    await websocket.send_json({"type": "error", "detail": "\"start\" must come once, before any audio"})
+                    continue
+                audio_format = control.get("format", "webm")
+                if audio_format not in STREAM_AUDIO_FORMATS:
+                    await websocket.send_json({
+                        "type": "error",
+                        "detail": f"format must be one of: {', '.join(STREAM_AUDIO_FORMATS)}"
+                    })
+                    continue
+                try:
+                    sample_rate = int(control.get("sample_rate", 16000))
+                except (TypeError, ValueError):
+                    sample_rate = 0
+                if sample_rate <= 0:
+                    await websocket.send_json({"type": "error", "detail": "sample_rate must be a positive integer"})
+                    continue
+                session = StreamingTranscriptionSession(
+                    get_transcriber(),
+                    audio_format=audio_format,
+                    sample_rate=sample_rate,
+                    on_update=send_update,
+                )
+            elif control.get("type") == "stop":
+                final = await session.finish() if session else {"type": "final", "text": "", "segments": 0}
+                await websocket.send_json(final)
+                await websocket.close()
+                session = None
+                break
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if session is not None:
+            session.cancel()
+
+
 @router.get("/health")
 async def health_check() -> dict:
     """Health check endpoint for the voice service."""
     return {
         "status": "ok",
         "groq_tts_configured": bool(os.getenv("GROQ_API_KEY")),
-        "groq_stt_configured": bool(os.getenv("GROQ_API_KEY"))
+        "groq_stt_configured": bool(os.getenv("GROQ_API_KEY")),
+        "tts_cache": get_tts_cache().stats(),
+        "tts_ttfb": tts_latency.stats(),
+        "tts_coalescing": tts_flight.stats(),
+        "stt": {**stt_limiter.stats(), **stt_stats.stats()}
     }